@@ -8,27 +8,120 @@ are not hard-coded to 2016. The date is taken from
 controlled by `set_election_config(...)`.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import copy
+import multiprocessing
+import shutil
+import sys
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple, Type, Any, Union
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.context import BaseContext
+from itertools import repeat
 from pathlib import Path
 from abc import ABC, abstractmethod
 
 import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
-import matplotlib.pyplot as plt
 
 from src.utils.data_utils import (
     load_polling_data,
     load_election_results,
     compute_metrics,
     get_current_election_date,
+    get_election_config,
+    parquet_available,
+    set_election_config,
 )
 from src.utils.logging_config import get_logger
+from src.utils.plotting import use_agg_backend
+
+# zlib level 1 instead of Pillow's default 6: state plots encode noticeably
+# faster for somewhat larger files.
+_PNG_COMPRESS_LEVEL = 1
+
+# Threads encoding and writing state PNGs while the next state is drawn
+_PLOT_WRITER_THREADS = 4
+
+
+def _write_png(rgba: np.ndarray, dpi: float, paths: List[Path]) -> None:
+    """
+    Encode a rendered RGBA canvas to PNG at `paths[0]` and copy it to the rest.
+
+    Produces the same file as `Figure.savefig` for that canvas, but only
+    touches the pixel array, so it can run in a writer thread while the
+    figure is reused for the next plot (Pillow releases the GIL while
+    compressing).
+    """
+    import matplotlib.image as mimage
+
+    mimage.imsave(
+        paths[0],
+        rgba.data,
+        format="png",
+        origin="upper",
+        dpi=dpi,
+        pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL},
+    )
+    for path in paths[1:]:
+        shutil.copyfile(paths[0], path)
+
+
+def _plot_states_worker(
+    model: "ElectionForecastModel",
+    items: List[Tuple[str, pd.DataFrame, pd.DataFrame]],
+    actual_margin: Dict[str, float],
+    election_config: Tuple[int, Optional[str]],
+) -> int:
+    """
+    Plot one chunk of states in a worker process.
+
+    The election config and Matplotlib backend are module-level state, so
+    they are set here rather than relying on the parent process's.
+    """
+    use_agg_backend()
+    set_election_config(*election_config)
+    return model._plot_states(items, actual_margin)
+
+
+def _render_png_pixels(fig: Any) -> Optional[np.ndarray]:
+    """
+    Render `fig` and return a copy of its RGBA canvas, if that is the image
+    `savefig` would write as PNG.
+
+    That holds for Agg-based canvases when the `savefig.*` rcParams leave
+    the figure's dpi, colours and bounding box alone. Otherwise (e.g. under
+    the svg or pdf backends, or with `savefig.dpi` set) this returns None
+    and the caller should use `savefig`.
+    """
+    import matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    rc = matplotlib.rcParams
+    canvas = fig.canvas
+    if not (
+        isinstance(canvas, FigureCanvasAgg)
+        and rc["savefig.dpi"] == "figure"
+        and rc["savefig.facecolor"] == "auto"
+        and rc["savefig.edgecolor"] == "auto"
+        and not rc["savefig.transparent"]
+        and rc["savefig.bbox"] is None
+    ):
+        return None
+    canvas.draw()
+    return np.array(canvas.buffer_rgba())
 
 
 class ElectionForecastModel(ABC):
     """Abstract base class for election forecasting models."""
 
+    # Every subclass, keyed by class name; filled in by __init_subclass__
+    # and read by src.models.registry.discover_models().
+    registry: ClassVar[Dict[str, Type["ElectionForecastModel"]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record each subclass in `ElectionForecastModel.registry`."""
+        super().__init_subclass__(**kwargs)
+        ElectionForecastModel.registry[cls.__name__] = cls
+
     def __init__(self, name: str, seed: Optional[int] = None) -> None:
         """
         Initialize the model.
@@ -39,9 +132,30 @@ class ElectionForecastModel(ABC):
                   (default: None for non-deterministic).
         """
         self.name = name
-        self.predictions: List[Dict[str, Any]] = []
+        # Column-oriented store: column name -> array, one row per prediction.
+        # Callers may also assign a ready-made DataFrame (e.g. loaded from CSV).
+        self.predictions: Union[Dict[str, np.ndarray], pd.DataFrame] = {}
+        self._data_cache: Optional[Tuple[pd.DataFrame, Dict[str, float]]] = None
+        # Election config the cache was loaded for (None: assigned directly)
+        self._data_cache_config: Optional[Tuple[int, Optional[str]]] = None
+        # (polls, polls sorted by state_code, sorted codes) used for plotting
+        self._sorted_polls: Optional[Tuple[pd.DataFrame, pd.DataFrame, np.ndarray]] = (
+            None
+        )
         self.logger = get_logger(f"{__name__}.{name}")
         self.rng = np.random.default_rng(seed)
+        # Parent of the per-state generators `run_forecast` hands out
+        self._seed_sequence = np.random.SeedSequence(seed)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Drop the cached data when pickling the model for worker processes;
+        workers are handed the per-state polls they need explicitly.
+        """
+        state = self.__dict__.copy()
+        state["_data_cache"] = None
+        state["_sorted_polls"] = None
+        return state
 
     @abstractmethod
     def fit_and_forecast(
@@ -62,67 +176,286 @@ class ElectionForecastModel(ABC):
         """
         raise NotImplementedError
 
+    def fit_and_update(
+        self,
+        state_polls: pd.DataFrame,
+        new_polls: pd.DataFrame,
+        forecast_date: pd.Timestamp,
+        election_date: pd.Timestamp,
+        actual_margin: float,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict[str, float]:
+        """
+        Forecast from the polls up to `forecast_date`, given which are new.
+
+        `run_forecast` visits each state's forecast dates in ascending order
+        and calls this hook with all polls up to `forecast_date`
+        (`state_polls`) and the subset added since the previous successful
+        call for the same state (`new_polls`; on the first call for a state
+        this is every poll in `state_polls`). Models that carry filter state
+        between dates can override this to update from `new_polls` alone.
+
+        The default ignores `new_polls` and refits with `fit_and_forecast`.
+        """
+        return self.fit_and_forecast(
+            state_polls, forecast_date, election_date, actual_margin, rng=rng
+        )
+
+    def batched_fit_and_forecast(
+        self,
+        states: List[str],
+        train_polls_by_state: Dict[str, pd.DataFrame],
+        forecast_date: pd.Timestamp,
+        election_date: pd.Timestamp,
+        actual_margin: Dict[str, float],
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Optionally forecast every state for one date in a single call.
+
+        Models whose per-state fit is a handful of array operations can
+        override this to vectorize across states; `run_forecast` then calls
+        it once per forecast date instead of calling `fit_and_update` for
+        each state and date.
+
+        Args:
+            states: States to forecast, in output order.
+            train_polls_by_state: Polls up to `forecast_date` for each state.
+            forecast_date: Date of the forecast.
+            election_date: Date of the election.
+            actual_margin: Actual margin for each state.
+            rng: NumPy random generator.
+
+        Returns:
+            dict mapping state to a `fit_and_forecast`-style result dict.
+        """
+        raise NotImplementedError
+
+    def _has_batched_forecast(self) -> bool:
+        """Whether this model overrides `batched_fit_and_forecast`."""
+        return (
+            type(self).batched_fit_and_forecast
+            is not ElectionForecastModel.batched_fit_and_forecast
+        )
+
+    def _has_incremental_update(self) -> bool:
+        """Whether this model overrides `fit_and_update`."""
+        return type(self).fit_and_update is not ElectionForecastModel.fit_and_update
+
     def load_data(self) -> Tuple[pd.DataFrame, Dict[str, float]]:
         """
         Load polling and election results data.
 
+        The result is cached on the instance, so repeated calls (e.g. one
+        `plot_state` per state) only parse the source files once. The cache
+        is reloaded if `set_election_config` has since switched to another
+        year or polls file.
+
         Returns:
             tuple of (polls DataFrame, actual_margin dict)
         """
-        polls = load_polling_data()
-        actual_margin = load_election_results()
-        return polls, actual_margin
+        config = get_election_config()
+        stale = (
+            self._data_cache_config is not None and self._data_cache_config != config
+        )
+        if self._data_cache is None or stale:
+            polls = load_polling_data()
+            actual_margin = load_election_results()
+            self._data_cache = (polls, actual_margin)
+            self._data_cache_config = config
+        return self._data_cache
+
+    @staticmethod
+    def _group_polls_by_state(
+        polls: pd.DataFrame, states: List[str]
+    ) -> Dict[str, Tuple[pd.DataFrame, np.ndarray, np.ndarray]]:
+        """
+        Split polls by state once, with a sorted middate index per state.
+
+        Returns:
+            dict mapping state code to (state_polls, order, sorted_middates_ns),
+            where `order` holds the row positions of the state's polls sorted
+            (stably) by middate and `sorted_middates_ns` the matching middates
+            as int64 nanoseconds. Polls without a middate are left out of
+            `order`, as they never pass a `middate <= date` filter.
+        """
+        wanted = set(states)
+        grouped: Dict[str, Tuple[pd.DataFrame, np.ndarray, np.ndarray]] = {}
+        for state, idx in polls.groupby("state_code", sort=False).indices.items():
+            if state not in wanted:
+                continue
+            state_polls = polls.iloc[idx]
+            middates = state_polls["middate"].to_numpy(dtype="datetime64[ns]")
+            middates_ns = middates.view("i8")
+            valid = np.flatnonzero(~np.isnat(middates))
+            order = valid[np.argsort(middates_ns[valid], kind="stable")]
+            grouped[state] = (state_polls, order, middates_ns[order])
+        return grouped
+
+    @staticmethod
+    def _cut_index(sorted_middates_ns: np.ndarray, forecast_date_ns: np.int64) -> int:
+        """Number of polls with middate <= forecast_date (binary search)."""
+        return int(np.searchsorted(sorted_middates_ns, forecast_date_ns, side="right"))
 
-    def _forecast_single_date(
+    @staticmethod
+    def _polls_up_to(
+        state_polls: pd.DataFrame, order: np.ndarray, cut: int
+    ) -> pd.DataFrame:
+        """
+        Return the first `cut` polls by middate (see `_cut_index`).
+
+        Rows keep their original order, matching a boolean-mask filter.
+        """
+        return state_polls.iloc[np.sort(order[:cut])]
+
+    def _forecast_state(
         self,
-        forecast_date: pd.Timestamp,
-        polls: pd.DataFrame,
-        actual_margin: Dict[str, float],
+        state: str,
+        state_group: Tuple[pd.DataFrame, np.ndarray, np.ndarray],
+        fd_info: List[Tuple[pd.Timestamp, np.int64]],
         election_date: pd.Timestamp,
+        state_margin: float,
         min_polls: int,
-        states: List[str],
-    ) -> List[Dict[str, Any]]:
+        rng: np.random.Generator,
+        verbose: bool = False,
+    ) -> List[Tuple[pd.Timestamp, Dict[str, float]]]:
         """
-        Helper to forecast all states for a single date (for parallelization).
+        Forecast a single state for every forecast date.
+
+        This is the unit of work for both the sequential and the parallel
+        code paths in `run_forecast`. `fd_info` holds the
+        (forecast_date, forecast_date_ns) pairs precomputed there: only
+        dates before the election, in ascending order so that each call to
+        `fit_and_update` only adds polls. Models that keep the default
+        `fit_and_update` are called through `fit_and_forecast` directly,
+        without slicing out the new polls. `rng` is this state's own
+        generator, shared by all of its forecast dates.
+
+        Returns:
+            list of (forecast_date, result) pairs.
         """
-        results: List[Dict[str, Any]] = []
+        results: List[Tuple[pd.Timestamp, Dict[str, float]]] = []
 
-        for state in states:
-            state_polls = polls[polls["state_code"] == state].copy()
-            if len(state_polls) < min_polls:
-                continue
+        state_polls, order, sorted_middates_ns = state_group
+        if len(state_polls) < min_polls:
+            return results
+
+        if verbose:
+            self.logger.info(f"Processing {state}: {len(state_polls)} polls")
 
-            train_polls = state_polls[state_polls["middate"] <= forecast_date].copy()
-            if len(train_polls) < min_polls:
+        # Only models that override fit_and_update use the new polls
+        incremental = self._has_incremental_update()
+        prev_cut = 0
+        for forecast_date, forecast_date_ns in fd_info:
+            cut = self._cut_index(sorted_middates_ns, forecast_date_ns)
+            if cut < min_polls:
                 continue
 
-            days_to_election = (election_date - forecast_date).days
-            if days_to_election <= 0:
+            train_polls = self._polls_up_to(state_polls, order, cut)
+
+            try:
+                if incremental:
+                    new_polls = state_polls.iloc[np.sort(order[prev_cut:cut])]
+                    result = self.fit_and_update(
+                        train_polls,
+                        new_polls,
+                        forecast_date,
+                        election_date,
+                        state_margin,
+                        rng=rng,
+                    )
+                else:
+                    result = self.fit_and_forecast(
+                        train_polls,
+                        forecast_date,
+                        election_date,
+                        state_margin,
+                        rng=rng,
+                    )
+                results.append((forecast_date, result))
+                prev_cut = cut
+            except Exception as e:
+                self.logger.error(f"Error in {state} on {forecast_date.date()}: {e}")
+
+        return results
+
+    def _forecast_batched(
+        self,
+        states: List[str],
+        grouped: Dict[str, Tuple[pd.DataFrame, np.ndarray, np.ndarray]],
+        fd_info: List[Tuple[pd.Timestamp, np.int64]],
+        election_date: pd.Timestamp,
+        actual_margin: Dict[str, float],
+        min_polls: int,
+        verbose: bool = False,
+    ) -> List[List[Tuple[pd.Timestamp, Dict[str, float]]]]:
+        """
+        Forecast all states with one `batched_fit_and_forecast` call per date.
+
+        Applies the same poll-count filters as `_forecast_state`, over the
+        same precomputed `fd_info`. States the batch fails on (or leaves
+        out) are forecast one by one with `fit_and_forecast`, so as in
+        `_forecast_state` only a state that fails on its own is skipped.
+
+        Returns:
+            list (aligned with `states`) of per-state lists of
+            (forecast_date, result) pairs.
+        """
+        results: Dict[str, List[Tuple[pd.Timestamp, Dict[str, float]]]] = {
+            state: [] for state in states
+        }
+        eligible = [state for state in states if len(grouped[state][0]) >= min_polls]
+        if verbose:
+            for state in eligible:
+                self.logger.info(f"Processing {state}: {len(grouped[state][0])} polls")
+
+        for forecast_date, forecast_date_ns in fd_info:
+            train_polls_by_state = {}
+            for state in eligible:
+                state_polls, order, sorted_middates_ns = grouped[state]
+                cut = self._cut_index(sorted_middates_ns, forecast_date_ns)
+                if cut >= min_polls:
+                    train_polls_by_state[state] = self._polls_up_to(
+                        state_polls, order, cut
+                    )
+            if not train_polls_by_state:
                 continue
 
+            date_states = list(train_polls_by_state)
             try:
-                state_margin = actual_margin.get(state, 0.0)
-                result = self.fit_and_forecast(
-                    train_polls,
+                batch = self.batched_fit_and_forecast(
+                    date_states,
+                    train_polls_by_state,
                     forecast_date,
                     election_date,
-                    state_margin,
+                    {state: actual_margin[state] for state in date_states},
                     rng=self.rng,
                 )
-                results.append(
-                    {
-                        "state": state,
-                        "forecast_date": forecast_date,
-                        "win_probability": result["win_probability"],
-                        "predicted_margin": result["predicted_margin"],
-                        "margin_std": result.get("margin_std", np.nan),
-                        "actual_margin": actual_margin.get(state, np.nan),
-                    }
-                )
             except Exception as e:
-                self.logger.error(f"Error in {state} on {forecast_date.date()}: {e}")
+                self.logger.error(f"Error on {forecast_date.date()}: {e}")
+                batch = {}
+            for state in date_states:
+                try:
+                    if state in batch:
+                        result = batch[state]
+                    else:
+                        # The batch failed or left this state out; one
+                        # failing state should not cost the others the date
+                        result = self.fit_and_forecast(
+                            train_polls_by_state[state],
+                            forecast_date,
+                            election_date,
+                            actual_margin[state],
+                            rng=self.rng,
+                        )
+                except Exception as e:
+                    self.logger.error(
+                        f"Error in {state} on {forecast_date.date()}: {e}"
+                    )
+                    continue
+                results[state].append((forecast_date, result))
 
-        return results
+        return [results[state] for state in states]
 
     def run_forecast(
         self,
@@ -137,10 +470,15 @@ class ElectionForecastModel(ABC):
         Args:
             forecast_dates: List of forecast dates. If None, use four
                 default dates in October/November of the election year.
+                Dates are visited in ascending order whatever order they
+                are given in, so a seeded model draws its Monte Carlo
+                samples for them in that order.
             min_polls: Minimum number of polls required to forecast a state.
             verbose: If True, log per-state progress.
-            n_workers: If None or <=1, run sequentially; otherwise use
-                ProcessPoolExecutor with the given number of workers.
+            n_workers: If None or <=1, run sequentially; otherwise fan the
+                states out over a ProcessPoolExecutor with the given number
+                of workers. Ignored by models that implement
+                `batched_fit_and_forecast`, which always run in-process.
 
         Returns:
             DataFrame of predictions with columns:
@@ -160,165 +498,392 @@ class ElectionForecastModel(ABC):
             ]
             forecast_dates = [pd.to_datetime(d) for d in default_dates]
 
+        # Per-date values shared by every state, computed once. Dates on or
+        # after the election are dropped here; ascending order lets
+        # fit_and_update() see only newly added polls.
+        fd_info = [
+            (forecast_date, np.int64(forecast_date.value))
+            for forecast_date in sorted(pd.Timestamp(d) for d in forecast_dates)
+            if (election_date - forecast_date).days > 0
+        ]
+
         polls, actual_margin = self.load_data()
         states = [
             s
             for s in polls["state_code"].unique()
             if pd.notna(s) and s in actual_margin
         ]
+        grouped = self._group_polls_by_state(polls, states)
+        # One child generator per state, spawned before dispatch, so seeded
+        # results do not depend on how states are split between workers
+        state_rngs = [
+            np.random.default_rng(child)
+            for child in self._seed_sequence.spawn(len(states))
+        ]
+
+        if self._has_batched_forecast():
+            # Vectorized execution: one call per forecast date for all states
+            self.predictions = self._collect_predictions(
+                states,
+                self._forecast_batched(
+                    states,
+                    grouped,
+                    fd_info,
+                    election_date,
+                    actual_margin,
+                    min_polls,
+                    verbose,
+                ),
+                actual_margin,
+                len(fd_info),
+            )
+        elif n_workers is None or n_workers <= 1 or len(states) <= 1:
+            # Sequential execution (a pool cannot help with a single state)
+            state_results = (
+                self._forecast_state(
+                    state,
+                    grouped[state],
+                    fd_info,
+                    election_date,
+                    actual_margin[state],
+                    min_polls,
+                    state_rng,
+                    verbose,
+                )
+                for state, state_rng in zip(states, state_rngs)
+            )
+            self.predictions = self._collect_predictions(
+                states, state_results, actual_margin, len(fd_info)
+            )
+        else:
+            # Parallel execution using ProcessPoolExecutor (parallelized by
+            # state). Each task only receives its own state's polls; states
+            # are sent in contiguous chunks so the model is unpickled once
+            # per chunk rather than once per state.
+            n_workers = min(n_workers, len(states))
+            if verbose:
+                self.logger.info(
+                    f"Submitting {len(states)} states to {n_workers} workers"
+                )
+            chunksize = max(1, -(-len(states) // n_workers))
+            with ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=self._pool_context()
+            ) as executor:
+                mapped_results = executor.map(
+                    self._forecast_state,
+                    states,
+                    [grouped[s] for s in states],
+                    repeat(fd_info),
+                    repeat(election_date),
+                    [actual_margin[s] for s in states],
+                    repeat(min_polls),
+                    state_rngs,
+                    chunksize=chunksize,
+                )
+                try:
+                    self.predictions = self._collect_predictions(
+                        states, mapped_results, actual_margin, len(fd_info)
+                    )
+                except Exception as e:
+                    self.logger.error(f"Parallel forecast failed: {e}")
+                    self.predictions = {}
 
-        self.predictions = []
+        return pd.DataFrame(self.predictions)
 
-        if n_workers is None or n_workers <= 1:
-            # Sequential execution
-            for state in states:
-                state_polls = polls[polls["state_code"] == state].copy()
-                if len(state_polls) < min_polls:
-                    continue
+    @staticmethod
+    def _pool_context() -> Optional[BaseContext]:
+        """
+        Start method for the per-state process pool.
 
-                if verbose:
-                    self.logger.info(f"Processing {state}: {len(state_polls)} polls")
+        On Linux, "fork" lets workers inherit the already-imported modules
+        instead of re-importing numpy/pandas/scipy in every worker; other
+        platforms keep their default (spawn on macOS and Windows).
+        """
+        if sys.platform.startswith("linux"):
+            return multiprocessing.get_context("fork")
+        return None
 
-                for forecast_date in forecast_dates:
-                    train_polls = state_polls[
-                        state_polls["middate"] <= forecast_date
-                    ].copy()
-                    if len(train_polls) < min_polls:
-                        continue
+    @staticmethod
+    def _collect_predictions(
+        states: List[str],
+        state_results: Iterable[List[Tuple[pd.Timestamp, Dict[str, float]]]],
+        actual_margin: Dict[str, float],
+        n_dates: int,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Gather per-state results into preallocated column arrays.
 
-                    days_to_election = (election_date - forecast_date).days
-                    if days_to_election <= 0:
-                        continue
+        Returns:
+            dict of column name -> array, trimmed to the rows filled.
+        """
+        n = len(states) * n_dates
+        # Fixed-width unicode (U2 for state codes) rather than Python objects
+        state_col = np.empty(n, dtype=np.asarray(states, dtype=str).dtype)
+        date_col = np.empty(n, dtype="datetime64[ns]")
+        win_col = np.full(n, np.nan)
+        margin_col = np.full(n, np.nan)
+        std_col = np.full(n, np.nan)
+        actual_col = np.full(n, np.nan)
 
-                    try:
-                        state_margin = actual_margin.get(state, 0.0)
-                        result = self.fit_and_forecast(
-                            train_polls,
-                            forecast_date,
-                            election_date,
-                            state_margin,
-                            rng=self.rng,
-                        )
-                        self.predictions.append(
-                            {
-                                "state": state,
-                                "forecast_date": forecast_date,
-                                "win_probability": result["win_probability"],
-                                "predicted_margin": result["predicted_margin"],
-                                "margin_std": result.get("margin_std", np.nan),
-                                "actual_margin": actual_margin.get(state, np.nan),
-                            }
-                        )
-                    except Exception as e:
-                        self.logger.error(
-                            f"Error in {state} on {forecast_date.date()}: {e}"
-                        )
-                        continue
-        else:
-            # Parallel execution using ProcessPoolExecutor (parallelized by date)
-            with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                futures = {}
-                for forecast_date in forecast_dates:
-                    if verbose:
-                        self.logger.info(
-                            f"Submitting forecast for {forecast_date.date()}"
-                        )
-                    future = executor.submit(
-                        self._forecast_single_date,
-                        forecast_date,
-                        polls,
-                        actual_margin,
-                        election_date,
-                        min_polls,
-                        states,
-                    )
-                    futures[future] = forecast_date
+        k = 0
+        for state, results in zip(states, state_results):
+            for forecast_date, result in results:
+                state_col[k] = state
+                date_col[k] = np.datetime64(forecast_date, "ns")
+                win_col[k] = result["win_probability"]
+                margin_col[k] = result["predicted_margin"]
+                std_col[k] = result.get("margin_std", np.nan)
+                actual_col[k] = actual_margin[state]
+                k += 1
 
-                for future in as_completed(futures):
-                    forecast_date = futures[future]
-                    try:
-                        date_results = future.result()
-                        self.predictions.extend(date_results)
-                        if verbose:
-                            self.logger.info(
-                                f"Completed {forecast_date.date()} "
-                                f"({len(date_results)} predictions)"
-                            )
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to process {forecast_date.date()}: {e}"
-                        )
+        return {
+            "state": state_col[:k],
+            "forecast_date": date_col[:k],
+            "win_probability": win_col[:k],
+            "predicted_margin": margin_col[:k],
+            "margin_std": std_col[:k],
+            "actual_margin": actual_col[:k],
+        }
 
-        return pd.DataFrame(self.predictions)
+    def predictions_frame(self) -> pd.DataFrame:
+        """
+        Return the predictions as a DataFrame.
+
+        The column arrays built by `run_forecast` are wrapped without
+        copying, so treat the result as read-only. A DataFrame assigned to
+        `self.predictions` is returned as-is rather than being copied into a
+        new frame. If its forecast_date column is not datetime64 (e.g. a CSV
+        read without parse_dates), it is parsed once and stored back, so
+        sorting and grouping by date never fall back to comparing Python
+        objects.
+        """
+        if isinstance(self.predictions, pd.DataFrame):
+            pred_df = self.predictions
+            if (
+                "forecast_date" in pred_df.columns
+                and pred_df["forecast_date"].dtype.kind != "M"
+            ):
+                pred_df = pred_df.assign(
+                    forecast_date=pd.to_datetime(pred_df["forecast_date"])
+                )
+                self.predictions = pred_df
+            return pred_df
+        return pd.DataFrame(self.predictions, copy=False)
 
     def save_results(self) -> pd.DataFrame:
         """
         Save predictions and metrics to CSV and text files.
 
+        When a Parquet engine is installed, predictions and metrics are also
+        written to `predictions/{name}.parquet` and `metrics/{name}.parquet`,
+        which reload faster and with dtypes intact (`election-plot` prefers
+        the predictions copy). Otherwise any stale Parquet copy from an
+        earlier run is removed so it cannot shadow the fresh CSV.
+
+        Metrics are written both as `metrics/{name}.csv` (read by the
+        comparison script) and as a human-readable `metrics/{name}.txt`.
+
         Returns:
             DataFrame of metrics as returned by compute_metrics().
         """
         Path("predictions").mkdir(parents=True, exist_ok=True)
         Path("metrics").mkdir(parents=True, exist_ok=True)
 
-        pred_df = pd.DataFrame(self.predictions)
+        pred_df = self.predictions_frame()
         pred_df.to_csv(f"predictions/{self.name}.csv", index=False)
+        self._write_parquet_copy(pred_df, Path(f"predictions/{self.name}.parquet"))
 
         metrics_df = compute_metrics(pred_df)
+        model_metrics_df = metrics_df.assign(model=self.name)
+        model_metrics_df.to_csv(f"metrics/{self.name}.csv", index=False)
+        self._write_parquet_copy(model_metrics_df, Path(f"metrics/{self.name}.parquet"))
         with open(f"metrics/{self.name}.txt", "w") as f:
             f.write(f"{self.name} - Evaluation Metrics\n")
-            for _, row in metrics_df.iterrows():
-                f.write(f"Forecast Date: {row['forecast_date']}\n")
-                f.write(f"  States: {row['n_states']}\n")
-                f.write(f"  Brier Score: {row['brier_score']:.4f}\n")
-                f.write(f"  Log Loss: {row['log_loss']:.4f}\n")
-                f.write(f"  MAE (Margin): {row['mae_margin']:.4f}\n\n")
+            for row in metrics_df.itertuples(index=False):
+                f.write(f"Forecast Date: {row.forecast_date}\n")
+                f.write(f"  States: {row.n_states}\n")
+                f.write(f"  Brier Score: {row.brier_score:.4f}\n")
+                f.write(f"  Log Loss: {row.log_loss:.4f}\n")
+                f.write(f"  MAE (Margin): {row.mae_margin:.4f}\n\n")
 
         return metrics_df
 
-    def plot_state(self, state: str) -> None:
+    @staticmethod
+    def _write_parquet_copy(df: pd.DataFrame, parquet_file: Path) -> None:
+        """Write `df` to `parquet_file`, or remove a stale copy if unsupported."""
+        if parquet_available():
+            df.to_parquet(parquet_file, index=False)
+        else:
+            parquet_file.unlink(missing_ok=True)
+
+    def plot_state(
+        self,
+        state: str,
+        ax: Optional[Any] = None,
+        polls: Optional[pd.DataFrame] = None,
+        actual_margin: Optional[Dict[str, float]] = None,
+    ) -> None:
         """
         Create time-series plot for a specific state showing model predictions over time.
 
         Saves PNG to both:
             plots/{model_name}/{state}.png          (legacy path, used by tests)
             plots/{model_name}/{election_year}/{state}.png  (year-specific path)
+
+        Args:
+            state: State code to plot.
+            ax: Optional Matplotlib Axes to draw on. It is cleared first and
+                its figure is left open, so callers plotting many states can
+                reuse one figure. If None, a new figure is created and closed.
+            polls: Optional prefetched polls DataFrame. If None, polls and
+                actual margins come from `load_data()`.
+            actual_margin: Optional prefetched dict of actual margins, used
+                together with `polls`.
         """
-        polls, actual_margin = self.load_data()
-        state_polls = polls[polls["state_code"] == state].copy()
+        if polls is None or actual_margin is None:
+            polls, actual_margin = self.load_data()
+        state_polls = self._state_polls(polls, state)
 
         # Require at least a few polls to make the plot meaningful
         if len(state_polls) < 10:
             return
 
-        pred_df = pd.DataFrame(self.predictions)
-        if pred_df.empty:
+        state_preds = self._state_predictions(state)
+        if state_preds is None:
             return
 
-        state_preds = pred_df[pred_df["state"] == state].copy()
-        if state_preds.empty:
-            return
+        self._draw_state(state, state_polls, state_preds, actual_margin, ax)
 
-        state_preds = state_preds.sort_values(by="forecast_date")  # type: ignore[call-overload]
+    def _state_polls(self, polls: pd.DataFrame, state: str) -> pd.DataFrame:
+        """
+        Return the rows of `polls` for one state via binary search.
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        A copy of `polls` sorted by state_code (stable, so each state's rows
+        keep their original order) is built on the first call and reused
+        while later calls pass the same frame, so plotting many states costs
+        one sort plus a pair of searchsorted lookups per state instead of a
+        full boolean-mask scan per state.
+        """
+        if self._sorted_polls is None or self._sorted_polls[0] is not polls:
+            sorted_polls = polls[polls["state_code"].notna()].sort_values(
+                "state_code", kind="stable"
+            )
+            codes = sorted_polls["state_code"].to_numpy(dtype=str)
+            self._sorted_polls = (polls, sorted_polls, codes)
 
-        forecast_dates = pd.to_datetime(state_preds["forecast_date"].values)
-        predicted_margins = state_preds["predicted_margin"].values
-        margin_stds = state_preds["margin_std"].values
+        _, sorted_polls, codes = self._sorted_polls
+        lo = int(np.searchsorted(codes, state, side="left"))
+        hi = int(np.searchsorted(codes, state, side="right"))
+        return sorted_polls.iloc[lo:hi]
 
-        # Uncertainty band (90% CI)
-        ax.fill_between(
-            forecast_dates,
-            predicted_margins - 1.645 * margin_stds,
-            predicted_margins + 1.645 * margin_stds,
-            alpha=0.25,
-            color="lightblue",
-            label="90% confidence interval",
-            zorder=1,
+    # Prediction columns used for plotting
+    _PLOT_COLUMNS = ("forecast_date", "predicted_margin", "margin_std")
+
+    def _state_predictions(self, state: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Return one state's plotted prediction columns in forecast_date order.
+
+        The rows are selected with a NumPy mask and ordered with argsort on
+        the column arrays, without building or sorting a DataFrame.
+
+        Returns:
+            dict of column name -> array, or None if the state has no
+            predictions.
+        """
+        if isinstance(self.predictions, pd.DataFrame):
+            pred_df = self.predictions_frame()
+            columns = {
+                col: pred_df[col].to_numpy() for col in ("state", *self._PLOT_COLUMNS)
+            }
+        else:
+            columns = self.predictions
+        if "state" not in columns:
+            return None
+
+        mask = columns["state"] == state
+        if not mask.any():
+            return None
+
+        dates = columns["forecast_date"][mask]
+        if dates.dtype.kind != "M":
+            # e.g. column arrays assigned by hand with string dates
+            dates = pd.to_datetime(dates).to_numpy()
+        order = np.argsort(dates, kind="stable")
+        state_preds = {col: columns[col][mask][order] for col in self._PLOT_COLUMNS}
+        state_preds["forecast_date"] = dates[order]
+        return state_preds
+
+    def _draw_state(
+        self,
+        state: str,
+        state_polls: pd.DataFrame,
+        state_preds: Union[pd.DataFrame, Dict[str, np.ndarray]],
+        actual_margin: Dict[str, float],
+        ax: Optional[Any] = None,
+        writer: Optional[Executor] = None,
+    ) -> Optional["Future[None]"]:
+        """
+        Draw and save one state's plot from its polls and its predictions.
+
+        `state_preds` is a DataFrame or a dict of column arrays with the
+        forecast_date, predicted_margin and margin_std columns, already
+        sorted by forecast_date. See `plot_state` for the output paths and
+        the meaning of `ax`.
+
+        If `writer` is given, the rendered canvas is handed to it for PNG
+        encoding and writing, and the returned future completes when the
+        files are written; otherwise they are written before returning.
+        """
+        # Imported here so forecasting-only processes never load matplotlib
+        import matplotlib.dates as mdates
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import PolyCollection
+
+        own_figure = ax is None
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 6))
+        else:
+            fig = ax.figure
+            ax.clear()
+
+        forecast_dates = pd.DatetimeIndex(
+            pd.to_datetime(np.asarray(state_preds["forecast_date"]))
         )
+        predicted_margins = np.asarray(state_preds["predicted_margin"])
+        margin_stds = np.asarray(state_preds["margin_std"])
 
-        # Raw polls
+        # Uncertainty band (90% CI), built directly as one polygon
+        # (lower edge forwards, upper edge backwards, the same winding
+        # fill_between uses) instead of going through its per-call
+        # interpolation and masking. The edge is stroked in the fill colour
+        # at the default linewidth, as fill_between does.
+        dates_num = mdates.date2num(forecast_dates)
+        # The half-width is computed once and shared by both edges
+        half_width = np.multiply(margin_stds, 1.645)
+        lower = np.subtract(predicted_margins, half_width)
+        upper = np.add(predicted_margins, half_width)
+        band = np.column_stack(
+            (
+                np.concatenate((dates_num, dates_num[::-1])),
+                np.concatenate((lower, upper[::-1])),
+            )
+        )
+        ax.xaxis_date()
+        ax.add_collection(
+            PolyCollection(
+                [band],
+                alpha=0.25,
+                facecolors="lightblue",
+                edgecolors="lightblue",
+                label="90% confidence interval",
+                zorder=1,
+                rasterized=True,
+            )
+        )
+
+        # Raw polls. The band and the (possibly thousands of) poll markers
+        # are rasterized so vector outputs (PDF/SVG) stay small; the
+        # forecast line below stays vector.
         ax.scatter(
             state_polls["middate"],
             state_polls["margin"],
@@ -328,6 +893,7 @@ class ElectionForecastModel(ABC):
             color="gray",
             zorder=2,
             marker="o",
+            rasterized=True,
         )
 
         # Forecast line
@@ -369,7 +935,7 @@ class ElectionForecastModel(ABC):
         )
         ax.legend(loc="best", fontsize=9)
         ax.grid(alpha=0.3, zorder=0)
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save in both the legacy and year-specific locations
         election_year = int(election_date.year)
@@ -378,12 +944,150 @@ class ElectionForecastModel(ABC):
         #    plots/{model_name}/{STATE}.png
         legacy_dir = Path("plots") / self.name
         legacy_dir.mkdir(parents=True, exist_ok=True)
-        plt.savefig(legacy_dir / f"{state}.png")
 
         # 2) Year-specific location used by your project:
         #    plots/{model_name}/{YEAR}/{STATE}.png
+        #    The figure is rendered and encoded once; this is a byte copy.
         year_dir = legacy_dir / str(election_year)
         year_dir.mkdir(parents=True, exist_ok=True)
-        plt.savefig(year_dir / f"{state}.png")
 
-        plt.close()
+        paths = [legacy_dir / f"{state}.png", year_dir / f"{state}.png"]
+
+        # Render now; the pixel copy leaves the figure free for reuse
+        rgba = _render_png_pixels(fig)
+        if rgba is None:
+            fig.savefig(paths[0], pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL})
+            shutil.copyfile(paths[0], paths[1])
+        if own_figure:
+            plt.close(fig)
+
+        if rgba is None:
+            return None
+        if writer is not None:
+            return writer.submit(_write_png, rgba, fig.dpi, paths)
+        _write_png(rgba, fig.dpi, paths)
+        return None
+
+    def plot_all_states(
+        self,
+        states: Optional[Iterable[str]] = None,
+        ax: Optional[Any] = None,
+        n_workers: Optional[int] = None,
+    ) -> int:
+        """
+        Plot many states with a single data load and a single figure.
+
+        Args:
+            states: State codes to plot. If None, every state with predictions.
+            ax: Optional Matplotlib Axes to reuse, as in `plot_state`. If None,
+                one figure is created for the whole batch and closed at the end.
+                Not used when the states are plotted by worker processes.
+            n_workers: Number of worker processes to split the states between
+                (default: None to plot them all in this process).
+
+        Returns:
+            Number of plots written (states without enough polls or without
+            predictions are skipped, as in `plot_state`).
+        """
+        polls, actual_margin = self.load_data()
+        pred_df = self.predictions_frame()
+        if pred_df.empty:
+            return 0
+        if states is None:
+            states = pred_df["state"].unique()
+
+        # Split the predictions by state once (hash groupby) instead of
+        # scanning them with a boolean mask per state. They are sorted first,
+        # so each group is already in forecast_date order. Polls are sliced
+        # from one state_code-sorted copy.
+        pred_groups = dict(
+            tuple(
+                pred_df.sort_values("forecast_date", kind="stable").groupby(
+                    "state", sort=False
+                )
+            )
+        )
+
+        items = []
+        for state in states:
+            state_polls = self._state_polls(polls, state)
+            state_preds = pred_groups.get(state)
+            # Same minimum as plot_state
+            if len(state_polls) < 10 or state_preds is None:
+                continue
+            items.append((state, state_polls, state_preds))
+
+        if n_workers is None or n_workers <= 1 or len(items) <= 1:
+            return self._plot_states(items, actual_margin, ax)
+
+        # Each worker gets one contiguous chunk of states with only those
+        # states' polls and predictions, and draws them on its own figure.
+        # The model itself is sent without its predictions.
+        n_workers = min(n_workers, len(items))
+        chunk_size = -(-len(items) // n_workers)
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+        plot_model = copy.copy(self)
+        plot_model.predictions = {}
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=self._pool_context()
+        ) as executor:
+            return sum(
+                executor.map(
+                    _plot_states_worker,
+                    repeat(plot_model),
+                    chunks,
+                    repeat(actual_margin),
+                    repeat(get_election_config()),
+                )
+            )
+
+    def _plot_states(
+        self,
+        items: List[Tuple[str, pd.DataFrame, pd.DataFrame]],
+        actual_margin: Dict[str, float],
+        ax: Optional[Any] = None,
+    ) -> int:
+        """
+        Draw and save (state, state_polls, state_preds) items on one figure.
+
+        Returns:
+            Number of plots written.
+        """
+        import matplotlib.pyplot as plt
+
+        own_figure = None
+        if ax is None:
+            own_figure, ax = plt.subplots(figsize=(12, 6))
+
+        # Drawing stays on this thread (one shared figure); PNG encoding and
+        # file writes for each state overlap with drawing the next one.
+        pending: Dict[str, "Future[None]"] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=_PLOT_WRITER_THREADS) as writer:
+                for state, state_polls, state_preds in items:
+                    try:
+                        future = self._draw_state(
+                            state,
+                            state_polls,
+                            state_preds,
+                            actual_margin,
+                            ax,
+                            writer=writer,
+                        )
+                        if future is not None:
+                            pending[state] = future
+                    except Exception as e:
+                        self.logger.warning(f"Could not plot {state}: {e}")
+        finally:
+            if own_figure is not None:
+                plt.close(own_figure)
+
+        n_plotted = 0
+        for state, future in pending.items():
+            try:
+                future.result()
+                n_plotted += 1
+            except Exception as e:
+                self.logger.warning(f"Could not plot {state}: {e}")
+
+        return n_plotted
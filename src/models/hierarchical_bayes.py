@@ -15,6 +15,7 @@ import pandas as pd  # type: ignore[import-untyped]
 from scipy.stats import norm
 from datetime import datetime
 from src.models.base_model import ElectionForecastModel
+from src.utils.kalman import kalman_filter_smoother
 from src.utils.data_utils import load_fundamentals
 
 
@@ -84,40 +85,9 @@ class HierarchicalBayesModel(ElectionForecastModel):
         Returns:
             tuple of (x_smooth, P_smooth): smoothed state estimates and variances
         """
-        T = len(dates)
-        x_filt = np.zeros(T)
-        P_filt = np.zeros(T)
-
-        # Initial state
-        x_filt[0] = observations[0]
-        P_filt[0] = obs_variance[0]
-
-        # Forward filter
-        for t in range(1, T):
-            dt = max(dates[t] - dates[t - 1], 1.0)
-
-            # Predict
-            x_pred = x_filt[t - 1] + mu * dt
-            P_pred = P_filt[t - 1] + sigma2 * dt
-
-            # Update
-            K = P_pred / (P_pred + obs_variance[t])
-            x_filt[t] = x_pred + K * (observations[t] - x_pred)
-            P_filt[t] = (1 - K) * P_pred
-
-        # Backward RTS smoother
-        x_smooth = np.copy(x_filt)
-        P_smooth = np.copy(P_filt)
-
-        for t in range(T - 2, -1, -1):
-            dt = max(dates[t + 1] - dates[t], 1.0)
-            P_pred = P_filt[t] + sigma2 * dt
-
-            if P_pred > 0:
-                J = P_filt[t] / P_pred
-                x_smooth[t] = x_filt[t] + J * (x_smooth[t + 1] - x_filt[t] - mu * dt)
-                P_smooth[t] = P_filt[t] + J**2 * (P_smooth[t + 1] - P_pred)
-
+        x_smooth, P_smooth = kalman_filter_smoother(
+            dates, observations, obs_variance, mu, sigma2
+        )
         return x_smooth[-1], max(P_smooth[-1], 1e-6)
 
     def fit_and_forecast(
@@ -239,7 +209,7 @@ class HierarchicalBayesModel(ElectionForecastModel):
 
 
 if __name__ == "__main__":
-    from src.utils.logging_config import setup_logging
+    from src.utils.logging_config import log_table, setup_logging
 
     warnings.filterwarnings("ignore")
     setup_logging(__name__)
@@ -248,4 +218,4 @@ if __name__ == "__main__":
     pred_df = model.run_forecast()
     metrics_df = model.save_results()
     model.logger.info(f"Total predictions: {len(pred_df)}")
-    model.logger.info(f"\n{metrics_df.to_string(index=False)}")
+    log_table(model.logger, metrics_df, index=False)
@@ -6,6 +6,7 @@ Brownian motion with drift + pollster biases + fundamentals prior
 
 import numpy as np
 from src.models.base_model import ElectionForecastModel
+from src.utils.kalman import kalman_filter_smoother
 
 
 class KalmanDiffusionModel(ElectionForecastModel):
@@ -28,46 +29,7 @@ class KalmanDiffusionModel(ElectionForecastModel):
         Returns:
             tuple of (x_smooth, P_smooth): smoothed state estimates and variances
         """
-        T = len(dates)
-        x_filt = np.zeros(T)
-        P_filt = np.zeros(T)
-        x_pred = np.zeros(T)
-        P_pred = np.zeros(T)
-
-        # Initial state
-        x_filt[0] = observations[0]
-        P_filt[0] = obs_variance[0]
-
-        # Forward filter
-        for t in range(1, T):
-            dt = max(dates[t] - dates[t - 1], 1.0)
-
-            # Predict
-            x_pred[t] = x_filt[t - 1] + mu * dt
-            P_pred[t] = P_filt[t - 1] + sigma2 * dt
-
-            # Update
-            S = P_pred[t] + obs_variance[t]
-            K = P_pred[t] / S
-            x_filt[t] = x_pred[t] + K * (observations[t] - x_pred[t])
-            P_filt[t] = (1.0 - K) * P_pred[t]
-
-        # Backward RTS smoother
-        x_smooth = np.copy(x_filt)
-        P_smooth = np.copy(P_filt)
-
-        for t in range(T - 2, -1, -1):
-            dt = max(dates[t + 1] - dates[t], 1.0)
-            denom = P_filt[t] + sigma2 * dt
-            if denom <= 0:
-                J = 0.0
-            else:
-                J = P_filt[t] / denom
-
-            x_smooth[t] = x_filt[t] + J * (x_smooth[t + 1] - x_filt[t] - mu * dt)
-            P_smooth[t] = P_filt[t] + J**2 * (P_smooth[t + 1] - P_filt[t] - sigma2 * dt)
-
-        return x_smooth, P_smooth
+        return kalman_filter_smoother(dates, observations, obs_variance, mu, sigma2)
 
     def fit_state_diffusion(self, state_polls, prior_mean=0.0, max_iter=10):
         """
@@ -235,7 +197,7 @@ class KalmanDiffusionModel(ElectionForecastModel):
 
 
 if __name__ == "__main__":
-    from src.utils.logging_config import setup_logging
+    from src.utils.logging_config import log_table, setup_logging
 
     setup_logging(__name__)
 
@@ -243,4 +205,4 @@ if __name__ == "__main__":
     pred_df = model.run_forecast()
     metrics_df = model.save_results()
     model.logger.info(f"Total predictions: {len(pred_df)}")
-    model.logger.info(f"\n{metrics_df.to_string(index=False)}")
+    log_table(model.logger, metrics_df, index=False)
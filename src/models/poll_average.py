@@ -56,9 +56,72 @@ class PollAverageModel(ElectionForecastModel):
             "margin_std": total_std,
         }
 
+    def batched_fit_and_forecast(
+        self,
+        states,
+        train_polls_by_state,
+        forecast_date,
+        election_date,
+        actual_margin,
+        rng=None,
+    ):
+        """Vectorized fit_and_forecast for all states on one forecast date"""
+        window_days = 14
+        cutoff = np.datetime64(forecast_date - pd.Timedelta(days=window_days), "ns")
+
+        # Select each state's recent polls, then reduce all states at once
+        # with bincount over a state index
+        margins = []
+        sizes = []
+        for state in states:
+            state_polls = train_polls_by_state[state]
+            recent = state_polls["middate"].to_numpy() >= cutoff
+            if np.count_nonzero(recent) < 3:
+                recent = slice(-5, None)
+            margins.append(state_polls["margin"].to_numpy(dtype=float)[recent])
+            sizes.append(state_polls["samplesize"].to_numpy(dtype=float)[recent])
+
+        counts = np.array([len(m) for m in margins])
+        group = np.repeat(np.arange(len(states)), counts)
+        margin = np.concatenate(margins)
+        size = np.concatenate(sizes)
+        n_states = len(states)
+
+        # Weight by sample size
+        weight_sum = np.bincount(group, size, n_states)
+        avg_margin = np.bincount(group, size * margin, n_states) / weight_sum
+
+        # Uncertainty estimation (unweighted sample std, ddof=1)
+        mean_margin = np.bincount(group, margin, n_states) / counts
+        sq_dev = (margin - mean_margin[group]) ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            empirical_std = np.sqrt(np.bincount(group, sq_dev, n_states) / (counts - 1))
+        avg_sample_size = np.bincount(group, size * size, n_states) / weight_sum
+        sampling_std = 1.0 / np.sqrt(avg_sample_size)
+
+        # Forecast horizon uncertainty
+        days_to_election = (election_date - forecast_date).days
+        horizon_uncertainty = 0.001 * days_to_election
+
+        # Combine uncertainties
+        total_std = np.maximum(np.maximum(empirical_std, sampling_std), 0.02)
+        total_std = np.sqrt(total_std**2 + horizon_uncertainty**2)
+
+        # Win probability via normal CDF
+        win_prob = np.clip(norm.cdf(avg_margin / total_std), 0.05, 0.95)
+
+        return {
+            state: {
+                "win_probability": win_prob[i],
+                "predicted_margin": avg_margin[i],
+                "margin_std": total_std[i],
+            }
+            for i, state in enumerate(states)
+        }
+
 
 if __name__ == "__main__":
-    from src.utils.logging_config import setup_logging
+    from src.utils.logging_config import log_table, setup_logging
 
     setup_logging(__name__)
 
@@ -66,4 +129,4 @@ if __name__ == "__main__":
     pred_df = model.run_forecast()
     metrics_df = model.save_results()
     model.logger.info(f"Total predictions: {len(pred_df)}")
-    model.logger.info(f"\n{metrics_df.to_string(index=False)}")
+    log_table(model.logger, metrics_df, index=False)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Model discovery shared by the command-line scripts.
+"""
+
+import importlib
+import inspect
+import pkgutil
+from functools import lru_cache
+from typing import Tuple, Type
+
+import src.models as models_package
+from src.models.base_model import ElectionForecastModel
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Modules in src.models that never define concrete models
+_NON_MODEL_MODULES = {"base_model", "registry"}
+
+
+@lru_cache(maxsize=1)
+def discover_models() -> Tuple[Tuple[str, Type[ElectionForecastModel]], ...]:
+    """
+    Auto-discover all model classes in the src.models package.
+
+    Importing a module is enough to register its models, since every
+    `ElectionForecastModel` subclass adds itself to
+    `ElectionForecastModel.registry` when it is defined. The result is
+    cached, so scripts run back-to-back in one process (as in
+    `election-run-all`) only walk the package once.
+
+    Returns:
+        Tuple of (model_class_name, model_class) pairs sorted by name.
+    """
+    prefix = f"{models_package.__name__}."
+
+    try:
+        for module_info in pkgutil.iter_modules(models_package.__path__):
+            if module_info.ispkg:
+                continue
+            if module_info.name.startswith("_"):
+                continue
+            if module_info.name in _NON_MODEL_MODULES:
+                continue
+
+            module_name = prefix + module_info.name
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                logger.warning(f"Could not import {module_name}: {e}")
+
+    except Exception as e:
+        logger.error(f"Error discovering models: {e}")
+
+    # Only concrete models defined in src.models (not e.g. test doubles)
+    return tuple(
+        sorted(
+            (name, cls)
+            for name, cls in ElectionForecastModel.registry.items()
+            if cls.__module__.startswith(prefix) and not inspect.isabstract(cls)
+        )
+    )
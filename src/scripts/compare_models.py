@@ -8,13 +8,31 @@ Generates comparison tables, rankings, and plots for all models
 import pandas as pd  # type: ignore[import-untyped]
 import matplotlib.pyplot as plt
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import glob
-from src.utils.logging_config import setup_logging, get_logger
+import os
+import re
+from src.utils.logging_config import setup_logging, get_logger, log_table
+from src.utils.plotting import use_agg_backend
 
 logger = get_logger(__name__)
 
 
+_METRICS_RECORD = re.compile(
+    r"Forecast Date:\s*(\S+)"
+    r".*?Brier Score:\s*(\S+)"
+    r".*?Log Loss:\s*(\S+)"
+    r".*?MAE \(Margin\):\s*(\S+)",
+    re.S,
+)
+
+_CSV_COLUMNS = {
+    "forecast_date": "date",
+    "brier_score": "brier",
+    "mae_margin": "mae",
+}
+
+
 def parse_metrics(filename):
     """
     Parse metrics from text file
@@ -25,62 +43,92 @@ def parse_metrics(filename):
     Returns:
         DataFrame with columns: date, brier, log_loss, mae
     """
-    metrics = []
-    with open(filename) as f:
-        lines = f.readlines()
-        current = {}
-        for line in lines:
-            if "Forecast Date:" in line:
-                if current:
-                    metrics.append(current)
-                current = {"date": line.split(":")[1].strip()}
-            elif "Brier Score:" in line:
-                current["brier"] = float(line.split(":")[1].strip())
-            elif "Log Loss:" in line:
-                current["log_loss"] = float(line.split(":")[1].strip())
-            elif "MAE (Margin):" in line:
-                current["mae"] = float(line.split(":")[1].strip())
-        if current:
-            metrics.append(current)
-    return pd.DataFrame(metrics)
+    rows = _METRICS_RECORD.findall(Path(filename).read_text())
+    return pd.DataFrame(rows, columns=["date", "brier", "log_loss", "mae"]).astype(
+        {"brier": float, "log_loss": float, "mae": float}
+    )
+
+
+def load_metrics_csv(filename):
+    """
+    Load metrics from the CSV written by save_results()
+
+    Args:
+        filename: Path to metrics CSV file
+
+    Returns:
+        DataFrame with columns: date, brier, log_loss, mae, model
+    """
+    df = pd.read_csv(filename)
+    return df.rename(columns=_CSV_COLUMNS)[
+        ["date", "brier", "log_loss", "mae", "model"]
+    ]
+
+
+def load_model_metrics(txt_path):
+    """
+    Load one model's metrics, preferring the CSV written alongside the text file
+
+    Older runs only have the text version, which is parsed instead.
+
+    Args:
+        txt_path: Path to the model's metrics text file
+
+    Returns:
+        DataFrame with columns: date, brier, log_loss, mae, model
+    """
+    stem = txt_path[: -len(".txt")]
+    csv_file = stem + ".csv"
+    if os.path.exists(csv_file):
+        return load_metrics_csv(csv_file)
+    df = parse_metrics(txt_path)
+    df["model"] = os.path.basename(stem)
+    return df
 
 
 def main():
     """Load all model metrics, compare performance, and generate visualizations"""
     setup_logging(__name__)
 
-    metrics_files = glob.glob("metrics/*.txt")
+    try:
+        with os.scandir("metrics") as entries:
+            metrics_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".txt") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        metrics_files = []
 
     if len(metrics_files) == 0:
         logger.warning("No metrics files found. Run models first.")
         return
 
-    all_metrics = []
-    for metrics_file in metrics_files:
-        model_name = Path(metrics_file).stem
-        df = parse_metrics(metrics_file)
-        df["model"] = model_name
-        all_metrics.append(df)
-
-    all_metrics = pd.concat(all_metrics, ignore_index=True)
+    # Each file is independent, so read them concurrently
+    with ThreadPoolExecutor(
+        max_workers=min(len(metrics_files), os.cpu_count() or 1)
+    ) as executor:
+        all_metrics = pd.concat(
+            executor.map(load_model_metrics, metrics_files), ignore_index=True
+        )
 
     # Create comparison tables
     logger.info("Brier Score (lower is better):")
     pivot_brier = all_metrics.pivot(index="date", columns="model", values="brier")
-    logger.info(f"\n{pivot_brier.to_string()}")
+    log_table(logger, pivot_brier)
 
     logger.info("\nLog Loss (lower is better):")
     pivot_ll = all_metrics.pivot(index="date", columns="model", values="log_loss")
-    logger.info(f"\n{pivot_ll.to_string()}")
+    log_table(logger, pivot_ll)
 
     logger.info("\nMAE Margin (lower is better):")
     pivot_mae = all_metrics.pivot(index="date", columns="model", values="mae")
-    logger.info(f"\n{pivot_mae.to_string()}")
+    log_table(logger, pivot_mae)
 
     logger.info("\nAverage performance across all forecast dates:")
     summary = all_metrics.groupby("model")[["brier", "log_loss", "mae"]].mean()
     summary = summary.round(4)
-    logger.info(f"\n{summary.to_string()}")
+    log_table(logger, summary)
 
     logger.info("\nModel rankings (1 = best)")
     rankings = pd.DataFrame(
@@ -92,74 +140,56 @@ def main():
     )
     rankings["Average Rank"] = rankings.mean(axis=1)
     rankings = rankings.sort_values("Average Rank")
-    logger.info(f"\n{rankings.to_string()}")
+    log_table(logger, rankings)
 
     comparison_table = all_metrics.pivot_table(
         index="date", columns="model", values=["brier", "log_loss", "mae"]
     )
     comparison_table.to_csv("model_comparison.csv")
 
-    models = all_metrics["model"].unique()
+    # Plot straight from the pivots above instead of slicing and
+    # re-parsing dates for every model
+    plot_dates = pd.to_datetime(pivot_brier.index)
+    models = pivot_brier.columns
 
     fig, axes = plt.subplots(1, 3, figsize=(15, 4))
     markers = ["o", "s", "^", "d", "v", "*", "p"]
-    colors = plt.cm.tab10(np.linspace(0, 1, len(models)))
-
-    for i, model in enumerate(models):
-        model_data = all_metrics[all_metrics["model"] == model].sort_values("date")
-        model_dates = pd.to_datetime(model_data["date"])
-        axes[0].plot(
-            model_dates,
-            model_data["brier"].values,
-            marker=markers[i % len(markers)],
-            label=model,
-            linewidth=2,
-            color=colors[i],
-            markersize=8,
-        )
-        axes[1].plot(
-            model_dates,
-            model_data["log_loss"].values,
-            marker=markers[i % len(markers)],
-            label=model,
-            linewidth=2,
-            color=colors[i],
-            markersize=8,
-        )
-        axes[2].plot(
-            model_dates,
-            model_data["mae"].values,
-            marker=markers[i % len(markers)],
-            label=model,
-            linewidth=2,
-            color=colors[i],
-            markersize=8,
-        )
-
-    axes[0].set_xlabel("Forecast Date")
-    axes[0].set_ylabel("Brier Score")
-    axes[0].set_title("Brier Score Over Time")
-    axes[0].legend()
-    axes[0].grid(alpha=0.3)
-    axes[0].tick_params(axis="x", rotation=45)
-
-    axes[1].set_xlabel("Forecast Date")
-    axes[1].set_ylabel("Log Loss")
-    axes[1].set_title("Log Loss Over Time")
-    axes[1].legend()
-    axes[1].grid(alpha=0.3)
-    axes[1].tick_params(axis="x", rotation=45)
-
-    axes[2].set_xlabel("Forecast Date")
-    axes[2].set_ylabel("MAE (Margin)")
-    axes[2].set_title("Margin Error Over Time")
-    axes[2].legend()
-    axes[2].grid(alpha=0.3)
-    axes[2].tick_params(axis="x", rotation=45)
+    colors = list(plt.cm.tab10(np.linspace(0, 1, len(models))))
+    styles = [f"-{markers[i % len(markers)]}" for i in range(len(models))]
+
+    panels = [
+        (pivot_brier, "Brier Score", "Brier Score Over Time"),
+        (pivot_ll, "Log Loss", "Log Loss Over Time"),
+        (pivot_mae, "MAE (Margin)", "Margin Error Over Time"),
+    ]
+    for ax, (pivot, ylabel, title) in zip(axes, panels):
+        pivot = pivot.set_axis(plot_dates, axis=0)
+        # Drop the dates a model lacks so its line joins the points it has
+        for model, style, color in zip(models, styles, colors):
+            pivot[model].dropna().plot(
+                ax=ax,
+                style=style,
+                color=color,
+                linewidth=2,
+                markersize=8,
+                label=model,
+            )
+        ax.set_xlabel("Forecast Date")
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.legend()
+        ax.grid(alpha=0.3)
+        ax.tick_params(axis="x", rotation=45)
 
     plt.tight_layout()
     plt.savefig("model_comparison.png")
 
 
-if __name__ == "__main__":
+def cli():
+    """Command-line entry point (`election-compare`)"""
+    use_agg_backend()
     main()
+
+
+if __name__ == "__main__":
+    cli()
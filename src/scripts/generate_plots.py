@@ -10,54 +10,16 @@ Usage:
     election-plot --year 2020 --polls-file data/polls/2020_president_polls.csv --all
 """
 
-import importlib
-import inspect
 import argparse
 import traceback
-from pathlib import Path
-from importlib import resources
 
-import pandas as pd  # type: ignore[import-untyped]
-
-import src.models as models_package
-from src.models.base_model import ElectionForecastModel
 from src.utils.logging_config import setup_logging, get_logger
-from src.utils.data_utils import load_polling_data, set_election_config
-
-logger = get_logger(__name__)
-
+from src.utils.plotting import use_agg_backend
 
-def discover_models():
-    """Auto-discover all model classes using importlib.resources."""
-    models = []
+# matplotlib, pandas and the models are imported inside main() once the
+# arguments are parsed, so `election-plot --help` does not pay for them.
 
-    try:
-        for item in resources.files(models_package).iterdir():
-            if not item.is_file():
-                continue
-            if not item.name.endswith(".py"):
-                continue
-            if item.name.startswith("_") or item.name == "base_model.py":
-                continue
-
-            module_name = f"src.models.{item.name[:-3]}"
-            try:
-                module = importlib.import_module(module_name)
-
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (
-                        issubclass(obj, ElectionForecastModel)
-                        and obj is not ElectionForecastModel
-                        and obj.__module__ == module_name
-                    ):
-                        models.append((name, obj))
-            except Exception as e:
-                logger.info(f"Warning: Could not import {module_name}: {e}")
-
-    except Exception as e:
-        logger.info(f"Error discovering models: {e}")
-
-    return sorted(models, key=lambda x: x[0])
+logger = get_logger(__name__)
 
 
 def main():
@@ -69,6 +31,7 @@ Examples:
   election-plot                                      # Plot key swing states (default year 2016)
   election-plot --all                                # Plot all states
   election-plot --states FL PA MI                    # Plot specific states
+  election-plot --all --parallel 4                   # Plot states in 4 worker processes
   election-plot --year 2020 --all                    # Plot all states (2020)
   election-plot --year 2020 --polls-file data/polls/2020_president_polls.csv --all
         """,
@@ -106,9 +69,28 @@ Examples:
         action="store_true",
         help="Enable verbose logging.",
     )
+    parser.add_argument(
+        "--parallel",
+        "-w",
+        type=int,
+        metavar="WORKERS",
+        help="Number of worker processes to plot states in (default: None for in-process)",
+    )
 
     args = parser.parse_args()
 
+    from pathlib import Path
+
+    import matplotlib.pyplot as plt
+    import pandas as pd  # type: ignore[import-untyped]
+
+    from src.models.registry import discover_models
+    from src.utils.data_utils import (
+        load_polling_data,
+        parquet_available,
+        set_election_config,
+    )
+
     # Setup logging
     setup_logging(__name__, level="DEBUG" if args.verbose else "INFO")
 
@@ -158,6 +140,9 @@ Examples:
     # Ensure base plots directory exists
     Path("plots").mkdir(parents=True, exist_ok=True)
 
+    # One figure is reused (and cleared) for every state of every model
+    fig, ax = plt.subplots(figsize=(12, 6))
+
     # Generate plots for each model
     total_plots = 0
     for model_name, ModelClass in model_classes:
@@ -165,40 +150,48 @@ Examples:
         try:
             model = ModelClass()
 
-            # Load predictions from CSV if they exist
-            pred_file = Path(f"predictions/{model.name}.csv")
+            # Load predictions, preferring the Parquet copy (dtypes stored,
+            # no parsing) and falling back to the CSV
+            pred_file = Path(f"predictions/{model.name}.parquet")
+            if not (parquet_available() and pred_file.exists()):
+                pred_file = pred_file.with_suffix(".csv")
             if pred_file.exists():
-                pred_df = pd.read_csv(pred_file)
+                if pred_file.suffix == ".parquet":
+                    pred_df = pd.read_parquet(pred_file)
+                else:
+                    # Parse forecast_date as datetime for correct plotting
+                    pred_df = pd.read_csv(pred_file, parse_dates=["forecast_date"])
 
                 if pred_df.empty:
                     logger.info(f"  Warning: Predictions file {pred_file} is empty")
                     continue
 
-                # Convert forecast_date to datetime for correct plotting
-                if "forecast_date" in pred_df.columns:
-                    pred_df["forecast_date"] = pd.to_datetime(pred_df["forecast_date"])
-
-                # Attach predictions in the same structure run_forecast() uses
-                model.predictions = pred_df.to_dict("records")
+                # plot_state() uses an assigned DataFrame as-is
+                model.predictions = pred_df
             else:
                 logger.info(f"  Warning: No predictions found at {pred_file}")
                 logger.info("  Run 'election-forecast' first to generate predictions")
                 continue
 
-            for state in states_to_plot:
-                try:
-                    model.plot_state(state)
-                    total_plots += 1
-                except Exception as e:
-                    logger.info(f"  Warning: Could not plot {state}: {e}")
+            total_plots += model.plot_all_states(
+                states_to_plot, ax=ax, n_workers=args.parallel
+            )
             logger.info(f"  ✓ Saved to plots/{model.name}/")
         except Exception as e:
             logger.info(f"  ERROR: {e}")
             traceback.print_exc()
 
+    plt.close(fig)
+
     logger.info(f"\n✓ Generated {total_plots} plots total")
     logger.info("  Plots saved in plots/ directory (organized by model)")
 
 
-if __name__ == "__main__":
+def cli():
+    """Command-line entry point (`election-plot`)"""
+    use_agg_backend()
     main()
+
+
+if __name__ == "__main__":
+    cli()
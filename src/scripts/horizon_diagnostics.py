@@ -18,6 +18,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 from src.diagnostics.horizon import compute_horizon_metrics
+from src.utils.plotting import use_agg_backend
 
 
 ELECTION_DATE = "2016-11-08"
@@ -121,4 +122,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    use_agg_backend()
     main()
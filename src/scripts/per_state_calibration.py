@@ -19,6 +19,8 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from src.utils.plotting import use_agg_backend
+
 
 # ---------------------------------------------------------------------
 # Paths
@@ -339,4 +341,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    use_agg_backend()
     main()
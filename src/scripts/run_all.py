@@ -2,16 +2,18 @@
 import argparse
 import sys
 import time
+from functools import lru_cache
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+# rich and the pipeline steps (pandas, matplotlib, the models) are imported
+# only once a run starts, so `election-run-all --help` returns immediately.
 
-from src.scripts.run_all_models import main as forecast_main
-from src.scripts.compare_models import main as compare_main
-from src.scripts.generate_plots import main as plot_main
 
-console = Console()
+@lru_cache(maxsize=1)
+def get_console():
+    """Return the shared rich Console, created on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 def run_with_temp_argv(argv, func):
@@ -28,6 +30,7 @@ def run_with_temp_argv(argv, func):
 
 def run_step(step_number, title, func, argv=None):
     """Run a step with a spinner, timing, and pretty output."""
+    console = get_console()
     console.rule(f"[bold cyan]Step {step_number}/3 • {title}")
     start = time.time()
 
@@ -85,6 +88,14 @@ def main():
     )
     args = parser.parse_args()
 
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from src.scripts.compare_models import cli as compare_main
+    from src.scripts.generate_plots import cli as plot_main
+    from src.scripts.run_all_models import main as forecast_main
+
+    console = get_console()
     timings = {}
 
     argv = ["election-forecast", "--dates", str(args.dates), "--year", str(args.year)]
@@ -1,60 +1,26 @@
 #!/usr/bin/env python3
-import importlib
-import inspect
 import argparse
+import importlib
+import multiprocessing
+import os
 import traceback
 import cProfile
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
-from datetime import timedelta
-from importlib import resources
 
-import src.models as models_package
-from src.models.base_model import ElectionForecastModel
-from src.utils.logging_config import setup_logging, get_logger
+from src.models.registry import discover_models
+from src.utils.logging_config import setup_logging, get_logger, log_table
 from src.utils.data_utils import set_election_config
 from src.utils.data_utils import get_current_election_date
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 
 logger = get_logger(__name__)
 
-
-def discover_models():
-    """
-    Auto-discover all model classes using importlib.resources.
-
-    Returns:
-        List of tuples (model_class_name, model_class) sorted by name.
-    """
-    models = []
-
-    try:
-        for item in resources.files(models_package).iterdir():
-            if not item.is_file():
-                continue
-            if not item.name.endswith(".py"):
-                continue
-            if item.name.startswith("_") or item.name == "base_model.py":
-                continue
-
-            module_name = f"src.models.{item.name[:-3]}"  # strip .py
-            try:
-                module = importlib.import_module(module_name)
-
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (
-                        issubclass(obj, ElectionForecastModel)
-                        and obj is not ElectionForecastModel
-                        and obj.__module__ == module_name
-                    ):
-                        models.append((name, obj))
-            except Exception as e:
-                logger.warning(f"Could not import {module_name}: {e}")
-
-    except Exception as e:
-        logger.error(f"Error discovering models: {e}")
-
-    return sorted(models, key=lambda x: x[0])
+# Forecast dates shown in each model's metrics log (all of them with -v)
+_LOGGED_METRICS_ROWS = 10
 
 
 def _default_election_and_start_dates(year: int) -> tuple[str, str]:
@@ -98,24 +64,136 @@ def generate_forecast_dates(
         year = int(pd.to_datetime(election_date).year)
         start_date = f"{year}-09-01"
 
-    election = pd.to_datetime(election_date)
-    start = pd.to_datetime(start_date)
+    one_day = np.timedelta64(1, "D")
+    election = pd.to_datetime(election_date).to_datetime64()
+    start = pd.to_datetime(start_date).to_datetime64()
 
     # Calculate total days available (end 1 day before election)
-    last_date = election - timedelta(days=1)
-    total_days = (last_date - start).days
-
-    # Generate n evenly-spaced dates (work backwards from election)
-    dates: List[pd.Timestamp] = []
-    for i in range(n_dates):
-        if n_dates > 1:
-            days_from_end = int(total_days * (n_dates - 1 - i) / (n_dates - 1))
+    last_date = election - one_day
+    total_days = int((last_date - start) // one_day)
+
+    # Generate n evenly-spaced dates (work backwards from election). The
+    # day offsets are computed in one exact integer pass, so no date can
+    # slip by a day through float truncation.
+    steps = np.arange(n_dates - 1, -1, -1, dtype=np.int64)
+    days_from_end = total_days * steps // max(n_dates - 1, 1)
+    dates = pd.DatetimeIndex(last_date - days_from_end.astype("timedelta64[D]"))
+
+    return dates.tolist()
+
+
+def _model_path(model_cls) -> str:
+    """Return the importable "module:qualname" path of a model class."""
+    return f"{model_cls.__module__}:{model_cls.__qualname__}"
+
+
+def _resolve_model(model_path: str):
+    """Import and return the model class named by `_model_path`."""
+    module_name, _, qualname = model_path.partition(":")
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _run_one(
+    model_path: str,
+    forecast_dates: List[pd.Timestamp],
+    year: int,
+    polls_file: Optional[str],
+    seed: Optional[int],
+    verbose: bool,
+    n_workers: Optional[int],
+) -> tuple[int, pd.DataFrame]:
+    """
+    Run and save a single model (executed in a worker process).
+
+    The model class is passed by its "module:qualname" path and imported in
+    the worker, so only a short string is pickled per task. The election
+    config is module-level state, so it is re-applied here rather than
+    relying on it being inherited from the parent process.
+
+    Returns:
+        tuple of (number of predictions, metrics DataFrame)
+    """
+    set_election_config(year=year, polls_file=polls_file)
+    model = _resolve_model(model_path)(seed=seed)
+    pred_df = model.run_forecast(
+        forecast_dates=forecast_dates,
+        verbose=verbose,
+        n_workers=n_workers,
+    )
+    metrics_df = model.save_results()
+    return len(pred_df), metrics_df
+
+
+def _log_result(result: tuple[int, pd.DataFrame], verbose: bool) -> None:
+    """
+    Log the prediction count and metrics returned by `_run_one`.
+
+    Unless verbose, only the first `_LOGGED_METRICS_ROWS` forecast dates
+    are logged; the full table is saved under metrics/ either way.
+    """
+    n_predictions, metrics_df = result
+    if verbose:
+        logger.info(f"Total predictions: {n_predictions}")
+    if verbose or len(metrics_df) <= _LOGGED_METRICS_ROWS:
+        log_table(logger, metrics_df, "Metrics:", index=False)
+    else:
+        log_table(
+            logger,
+            metrics_df.head(_LOGGED_METRICS_ROWS),
+            f"Metrics (first {_LOGGED_METRICS_ROWS} of {len(metrics_df)} dates):",
+            index=False,
+        )
+
+
+def _start_profiler(path: str) -> Callable[[], None]:
+    """
+    Start profiling this process and return a function that stops it.
+
+    pyinstrument's sampling profiler is used when it is installed: unlike
+    cProfile it does not hook every function call, so pandas/numpy-heavy
+    code is not slowed down and the profile is not skewed. It writes an
+    HTML report if `path` ends in ".html" and a text call tree otherwise.
+    A ".prof" path (or a missing pyinstrument) uses cProfile instead and
+    writes stats for snakeviz.
+
+    Args:
+        path: File to write the profile to.
+
+    Returns:
+        Function that stops the profiler and writes `path`.
+    """
+    if not path.endswith(".prof"):
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument is not installed; profiling with cProfile")
         else:
-            days_from_end = 0
-        forecast_date = last_date - timedelta(days=days_from_end)
-        dates.append(forecast_date)
+            sampler = Profiler()
+            sampler.start()
+
+            def stop_sampler() -> None:
+                sampler.stop()
+                if path.endswith(".html"):
+                    sampler.write_html(path)
+                else:
+                    Path(path).write_text(sampler.output_text())
+                logger.info(f"\nProfiling data saved to {path}")
 
-    return dates
+            return stop_sampler
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    def stop_profiler() -> None:
+        profiler.disable()
+        profiler.dump_stats(path)
+        logger.info(f"\nProfiling data saved to {path}")
+        logger.info(f"View with: snakeviz {path}")
+
+    return stop_profiler
 
 
 def main():
@@ -132,6 +210,7 @@ Examples:
   election-forecast -v                     # Verbose output
   election-forecast --parallel 4           # Use 4 parallel workers
   election-forecast -w 8                   # Use 8 parallel workers
+  election-forecast --serial               # Run models one at a time in-process
         """,
     )
     parser.add_argument(
@@ -166,7 +245,11 @@ Examples:
         "-p",
         type=str,
         metavar="FILE",
-        help="Enable profiling and save to FILE (e.g., forecast.prof)",
+        help=(
+            "Profile the run (models run in-process) and save to FILE: "
+            "forecast.html or forecast.txt with pyinstrument, "
+            "forecast.prof for cProfile/snakeviz"
+        ),
     )
     parser.add_argument(
         "--seed",
@@ -182,18 +265,25 @@ Examples:
         metavar="WORKERS",
         help="Number of parallel workers for state-level parallelization (default: None for sequential)",
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run the models one after another in this process (for debugging)",
+    )
 
     args = parser.parse_args()
 
-    if args.profile:
-        profiler = cProfile.Profile()
-        profiler.enable()
-
     # Configure global election year / polls file for all downstream loaders
     set_election_config(year=args.year, polls_file=args.polls_file)
 
     setup_logging(__name__, level="DEBUG" if args.verbose else "INFO")
 
+    stop_profiler = None
+    if args.profile:
+        stop_profiler = _start_profiler(args.profile)
+        # Work done in worker processes would be invisible to the profiler
+        args.serial = True
+
     election_date, start_date = _default_election_and_start_dates(args.year)
     forecast_dates = generate_forecast_dates(
         n_dates=args.dates,
@@ -219,30 +309,46 @@ Examples:
         for name, _ in model_classes:
             logger.info(f"  - {name}")
 
-    for model_name, ModelClass in model_classes:
-        logger.info(f"\nRunning: {model_name}")
-
-        try:
-            model = ModelClass(seed=args.seed)
-            pred_df = model.run_forecast(
-                forecast_dates=forecast_dates,
-                verbose=args.verbose,
-                n_workers=args.parallel,
-            )
-            metrics_df = model.save_results()
-
-            if args.verbose:
-                logger.info(f"Total predictions: {len(pred_df)}")
-            logger.info(f"Metrics:\n{metrics_df.to_string(index=False)}")
-        except Exception as e:
-            logger.error(f"ERROR running {model_name}: {e}")
-            traceback.print_exc()
+    run_args = (
+        forecast_dates,
+        args.year,
+        args.polls_file,
+        args.seed,
+        args.verbose,
+        args.parallel,
+    )
 
-    if args.profile:
-        profiler.disable()
-        profiler.dump_stats(args.profile)
-        logger.info(f"\nProfiling data saved to {args.profile}")
-        logger.info("View with: snakeviz {args.profile}")
+    if args.serial:
+        for model_name, ModelClass in model_classes:
+            logger.info(f"\nRunning: {model_name}")
+            try:
+                _log_result(_run_one(_model_path(ModelClass), *run_args), args.verbose)
+            except Exception as e:
+                logger.error(f"ERROR running {model_name}: {e}")
+                traceback.print_exc()
+    else:
+        # Models are independent, so run each one in its own process and
+        # report them as they finish. "spawn" keeps workers from inheriting
+        # matplotlib/logging state from the parent.
+        max_workers = min(len(model_classes), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = {
+                executor.submit(_run_one, _model_path(ModelClass), *run_args): name
+                for name, ModelClass in model_classes
+            }
+            for future in as_completed(futures):
+                model_name = futures[future]
+                logger.info(f"\nFinished: {model_name}")
+                try:
+                    _log_result(future.result(), args.verbose)
+                except Exception as e:
+                    logger.error(f"ERROR running {model_name}: {e}")
+                    traceback.print_exc()
+
+    if stop_profiler is not None:
+        stop_profiler()
 
 
 if __name__ == "__main__":
@@ -8,7 +8,11 @@ files (like 2020_president_polls.csv).
 """
 # mypy: ignore-errors
 
-from typing import Dict, List, Optional
+import os
+import tempfile
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Callable, Dict, List, Optional, Tuple
 import pandas as pd  # type: ignore[import-untyped]
 import numpy as np
 
@@ -19,6 +23,12 @@ import numpy as np
 CURRENT_ELECTION_YEAR: int = 2016
 CURRENT_POLLS_FILE: Optional[str] = None  # if None, use sensible default per year
 
+# Set to 1 to parse CSVs with pandas' multithreaded pyarrow engine
+FAST_IO_ENV_VAR = "ELECTION_FAST_IO"
+
+# Bump when the polling preprocessing changes, to invalidate Parquet caches
+_POLLS_CACHE_VERSION = 1
+
 
 def set_election_config(year: int = 2016, polls_file: Optional[str] = None) -> None:
     """
@@ -36,6 +46,13 @@ def set_election_config(year: int = 2016, polls_file: Optional[str] = None) -> N
     CURRENT_POLLS_FILE = polls_file
 
 
+def get_election_config() -> Tuple[int, Optional[str]]:
+    """
+    Return the (year, polls_file) pair set by `set_election_config`.
+    """
+    return CURRENT_ELECTION_YEAR, CURRENT_POLLS_FILE
+
+
 def get_election_date(year: int) -> str:
     """
     Return the election day (YYYY-MM-DD) for a given year.
@@ -114,6 +131,91 @@ _STATE_NAME_TO_ABBREV: Dict[str, str] = {
 }
 
 
+# ---------------------------------------------------------------------
+# CSV reading
+# ---------------------------------------------------------------------
+
+
+def fast_io_enabled() -> bool:
+    """
+    Return True if the ELECTION_FAST_IO environment variable opts in to
+    pyarrow CSV parsing and pyarrow is installed.
+    """
+    flag = os.getenv(FAST_IO_ENV_VAR, "").strip().lower()
+    if flag in ("", "0", "false", "no"):
+        return False
+    return find_spec("pyarrow") is not None
+
+
+def read_csv(path: str, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV into a numpy-backed DataFrame.
+
+    With ELECTION_FAST_IO=1 (and pyarrow installed) the file is tokenized
+    by pyarrow's multithreaded C++ reader via ``engine="pyarrow"``;
+    otherwise pandas' default C parser is used. Callers parse any date
+    columns themselves, so both paths give the same frame downstream.
+    """
+    if fast_io_enabled():
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    return pd.read_csv(path, **kwargs)
+
+
+# ---------------------------------------------------------------------
+# Optional Parquet support
+# ---------------------------------------------------------------------
+
+
+@lru_cache(maxsize=1)
+def parquet_available() -> bool:
+    """
+    Return True if pandas can read and write Parquet files.
+
+    Parquet needs an optional engine (pyarrow or fastparquet); without one,
+    callers stick to CSV.
+    """
+    return any(find_spec(engine) is not None for engine in ("pyarrow", "fastparquet"))
+
+
+def _load_with_parquet_cache(
+    csv_file: str, cache_file: str, load: Callable[[], pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    Return `load()`, reusing a Parquet copy of its result when it is current.
+
+    The cache is used when it is at least as new as `csv_file`; otherwise
+    `load()` runs and its result is written to `cache_file` for next time.
+    An unreadable cache counts as a miss. The cache is written to a
+    temporary file and renamed into place, so concurrent loaders (e.g.
+    worker processes) never read a half-written copy. Without a Parquet
+    engine this is just `load()`.
+    """
+    if not parquet_available():
+        return load()
+
+    try:
+        if os.path.getmtime(cache_file) >= os.path.getmtime(csv_file):
+            return pd.read_parquet(cache_file)
+    except Exception:
+        pass  # no cache yet, or a stale/corrupt one; rebuild it below
+
+    df = load()
+    tmp_file = None
+    try:
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(cache_file) or ".", suffix=".tmp"
+        )
+        os.close(fd)
+        df.to_parquet(tmp_file)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # e.g. a read-only data directory; the cache is optional
+    finally:
+        if tmp_file is not None and os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+    return df
+
+
 # ---------------------------------------------------------------------
 # 2016-specific polling loader (original timeseries)
 # ---------------------------------------------------------------------
@@ -128,10 +230,12 @@ def _load_polling_data_2016() -> pd.DataFrame:
             middate, dem, rep, margin, dem_proportion,
             samplesize, pollster, state_code
     """
-    polls = pd.read_csv("data/polls/fivethirtyeight_2016_polls_timeseries.csv")
+    polls = read_csv("data/polls/fivethirtyeight_2016_polls_timeseries.csv")
     polls["startdate"] = pd.to_datetime(polls["startdate"])
     polls["enddate"] = pd.to_datetime(polls["enddate"])
-    polls["middate"] = polls["startdate"] + (polls["enddate"] - polls["startdate"]) / 2
+    # Same resolution whichever CSV engine parsed the dates
+    middate = polls["startdate"] + (polls["enddate"] - polls["startdate"]) / 2
+    polls["middate"] = middate.astype("datetime64[ns]")
 
     polls["dem"] = polls["rawpoll_clinton"]
     polls["rep"] = polls["rawpoll_trump"]
@@ -167,7 +271,7 @@ def _load_polling_data_fte_long(polls_file: str, cycle: int) -> pd.DataFrame:
     Returns:
         DataFrame with the same core columns as `_load_polling_data_2016`.
     """
-    polls_raw = pd.read_csv(polls_file)
+    polls_raw = read_csv(polls_file)
     polls = polls_raw.copy()
 
     # Filter by cycle if present
@@ -232,7 +336,9 @@ def _load_polling_data_fte_long(polls_file: str, cycle: int) -> pd.DataFrame:
 
     wide["margin"] = (wide["dem"] - wide["rep"]) / wide["total"]
     wide["dem_proportion"] = wide["dem"] / wide["total"]
-    wide["middate"] = wide["startdate"] + (wide["enddate"] - wide["startdate"]) / 2
+    # Same resolution whichever CSV engine parsed the dates
+    middate = wide["startdate"] + (wide["enddate"] - wide["startdate"]) / 2
+    wide["middate"] = middate.astype("datetime64[ns]")
 
     wide["state_code"] = wide["state"].map(_STATE_NAME_TO_ABBREV)
 
@@ -270,17 +376,27 @@ def load_polling_data() -> pd.DataFrame:
       - Otherwise, it expects a FiveThirtyEight-style CSV (either provided via
         CURRENT_POLLS_FILE or inferred as `data/polls/{year}_president_polls.csv`)
         and parses it with `_load_polling_data_fte_long`.
+
+    When a Parquet engine is installed, the preprocessed polls are also
+    saved next to the CSV (`<name>.<year>.v<N>.parquet`) and reused until
+    the CSV changes.
     """
     year = CURRENT_ELECTION_YEAR
     polls_file = CURRENT_POLLS_FILE
 
     if year == 2016 and polls_file is None:
-        return _load_polling_data_2016()
+        csv_file = "data/polls/fivethirtyeight_2016_polls_timeseries.csv"
+        load = _load_polling_data_2016
+    else:
+        csv_file = polls_file or f"data/polls/{year}_president_polls.csv"
 
-    if polls_file is None:
-        polls_file = f"data/polls/{year}_president_polls.csv"
+        def load() -> pd.DataFrame:
+            return _load_polling_data_fte_long(polls_file=csv_file, cycle=year)
 
-    return _load_polling_data_fte_long(polls_file=polls_file, cycle=year)
+    cache_file = (
+        f"{os.path.splitext(csv_file)[0]}.{year}.v{_POLLS_CACHE_VERSION}.parquet"
+    )
+    return _load_with_parquet_cache(csv_file, cache_file, load)
 
 
 # ---------------------------------------------------------------------
@@ -295,7 +411,7 @@ def _load_election_results_year(year: int) -> Dict[str, float]:
     Returns:
         dict mapping state code to actual Democratic margin for that year.
     """
-    results = pd.read_csv(
+    results = read_csv(
         "data/election_results/mit_president_state_1976_2020.csv", sep="\t"
     )
     results_year = results[results["year"] == year].copy()
@@ -353,7 +469,7 @@ def load_fundamentals() -> Dict[str, Dict[str, float]]:
         dict mapping state code to fundamentals dict with keys:
             margin, margin_2012, margin_2008
     """
-    results = pd.read_csv(
+    results = read_csv(
         "data/election_results/mit_president_state_1976_2020.csv", sep="\t"
     )
 
@@ -0,0 +1,102 @@
+"""
+Kalman filter / RTS smoother shared by the diffusion models.
+
+The models all track a scalar latent margin that follows Brownian motion
+with drift, observed through noisy polls. The forward/backward recursions
+are tight scalar loops, so they are compiled with numba when it is
+installed (``pip install election-forecasting[fast]``) and otherwise run
+as plain Python with identical results.
+"""
+
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+
+        return decorator
+
+
+@njit(cache=True)
+def _kalman_recursion(
+    dates: np.ndarray,
+    observations: np.ndarray,
+    obs_variance: np.ndarray,
+    mu: float,
+    sigma2: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Forward Kalman filter and backward RTS pass over float64 arrays."""
+    T = dates.shape[0]
+    x_filt = np.zeros(T)
+    P_filt = np.zeros(T)
+
+    # Initial state
+    x_filt[0] = observations[0]
+    P_filt[0] = obs_variance[0]
+
+    # Forward filter
+    for t in range(1, T):
+        dt = max(dates[t] - dates[t - 1], 1.0)
+
+        # Predict
+        x_pred = x_filt[t - 1] + mu * dt
+        P_pred = P_filt[t - 1] + sigma2 * dt
+
+        # Update
+        K = P_pred / (P_pred + obs_variance[t])
+        x_filt[t] = x_pred + K * (observations[t] - x_pred)
+        P_filt[t] = (1.0 - K) * P_pred
+
+    # Backward RTS smoother
+    x_smooth = x_filt.copy()
+    P_smooth = P_filt.copy()
+
+    for t in range(T - 2, -1, -1):
+        dt = max(dates[t + 1] - dates[t], 1.0)
+        P_pred = P_filt[t] + sigma2 * dt
+
+        if P_pred > 0:
+            J = P_filt[t] / P_pred
+            x_smooth[t] = x_filt[t] + J * (x_smooth[t + 1] - x_filt[t] - mu * dt)
+            P_smooth[t] = P_filt[t] + J**2 * (P_smooth[t + 1] - P_pred)
+
+    return x_smooth, P_smooth
+
+
+def kalman_filter_smoother(
+    dates: Any,
+    observations: Any,
+    obs_variance: Any,
+    mu: float,
+    sigma2: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Kalman filter + RTS smoother for Brownian motion with drift.
+
+    Args:
+        dates: Array of time points (in days)
+        observations: Array of poll margins
+        obs_variance: Array of observation variances
+        mu: Drift parameter
+        sigma2: Diffusion variance
+
+    Returns:
+        tuple of (x_smooth, P_smooth): smoothed state estimates and variances
+    """
+    return _kalman_recursion(
+        np.ascontiguousarray(dates, dtype=np.float64),
+        np.ascontiguousarray(observations, dtype=np.float64),
+        np.ascontiguousarray(obs_variance, dtype=np.float64),
+        float(mu),
+        float(sigma2),
+    )
@@ -3,7 +3,7 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 
 def setup_logging(
@@ -61,3 +61,28 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(name)
+
+
+def log_table(
+    logger: logging.Logger,
+    table: Any,
+    title: str = "",
+    level: int = logging.INFO,
+    **to_string_kwargs: Any,
+) -> None:
+    """
+    Log a DataFrame as a text table below an optional title line.
+
+    `table.to_string()` is only called if `logger` would actually emit a
+    record at `level`, so large tables cost nothing when that level is
+    filtered out.
+
+    Args:
+        logger: Logger to write to
+        table: DataFrame (or anything with a `to_string` method)
+        title: Text on the line before the table
+        level: Logging level of the record
+        **to_string_kwargs: Passed to `table.to_string()`, e.g. index=False
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, "%s\n%s", title, table.to_string(**to_string_kwargs))
@@ -0,0 +1,26 @@
+"""
+Matplotlib setup shared by the plotting scripts.
+"""
+
+import os
+import sys
+
+
+def use_agg_backend() -> None:
+    """
+    Switch Matplotlib to the non-interactive Agg backend.
+
+    The scripts only write figures to disk, so they need neither a display
+    nor a GUI event loop. The backend is process-wide state: call this from
+    command-line entry points (or worker processes), not from functions
+    that may be imported and called by other code.
+
+    If Matplotlib is not imported yet, this only sets `MPLBACKEND`, so it
+    costs nothing for runs that never plot (e.g. `--help`).
+    """
+    if "matplotlib" in sys.modules:
+        import matplotlib
+
+        matplotlib.use("Agg")
+    else:
+        os.environ["MPLBACKEND"] = "Agg"
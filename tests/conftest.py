@@ -4,6 +4,26 @@ import pytest
 import pandas as pd
 import numpy as np
 
+from src.models.base_model import ElectionForecastModel
+
+
+class MockModel(ElectionForecastModel):
+    """Mock model for testing base class functionality"""
+
+    def __init__(self):
+        super().__init__("mock_model")
+
+    def fit_and_forecast(
+        self, state_polls, forecast_date, election_date, actual_margin, rng=None
+    ):
+        """Simple mock forecast"""
+        avg_margin = state_polls["margin"].mean()
+        return {
+            "win_probability": 0.5 + avg_margin,
+            "predicted_margin": avg_margin,
+            "margin_std": 0.05,
+        }
+
 
 @pytest.fixture
 def sample_polls():
@@ -38,6 +58,23 @@ def forecast_dates():
     return [pd.to_datetime("2016-10-15"), pd.to_datetime("2016-11-01")]
 
 
+@pytest.fixture
+def multi_state_polls(sample_polls):
+    """Sample polls for FL, repeated as polls for PA"""
+    return pd.concat(
+        [sample_polls, sample_polls.assign(state_code="PA")], ignore_index=True
+    )
+
+
+@pytest.fixture
+def forecasted_model(multi_state_polls, sample_actual_results, forecast_dates):
+    """MockModel with FL and PA forecasts for the standard forecast dates"""
+    model = MockModel()
+    model._data_cache = (multi_state_polls, sample_actual_results)
+    model.run_forecast(forecast_dates=forecast_dates, min_polls=5)
+    return model
+
+
 @pytest.fixture
 def election_date():
     """Election date"""
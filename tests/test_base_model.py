@@ -1,26 +1,58 @@
 """Tests for base model class"""
 
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import patch
 from src.models.base_model import ElectionForecastModel
+from tests.conftest import MockModel
 
 
-class MockModel(ElectionForecastModel):
-    """Mock model for testing base class functionality"""
+class NoisyModel(MockModel):
+    """Seeded mock model whose forecasts draw from the given generator"""
 
     def __init__(self):
-        super().__init__("mock_model")
+        ElectionForecastModel.__init__(self, "noisy_model", seed=42)
 
     def fit_and_forecast(
         self, state_polls, forecast_date, election_date, actual_margin, rng=None
     ):
-        """Simple mock forecast"""
-        avg_margin = state_polls["margin"].mean()
+        """Mock forecast with a random win probability"""
+        result = super().fit_and_forecast(
+            state_polls, forecast_date, election_date, actual_margin, rng=rng
+        )
+        result["win_probability"] = rng.random()
+        return result
+
+
+class FlakyBatchedModel(MockModel):
+    """Mock model whose batched forecast raises or drops PA"""
+
+    def __init__(self, mode):
+        super().__init__()
+        self.mode = mode
+
+    def batched_fit_and_forecast(
+        self,
+        states,
+        train_polls_by_state,
+        forecast_date,
+        election_date,
+        actual_margin,
+        rng=None,
+    ):
+        """Mock batched forecast that fails for PA"""
+        if self.mode == "raise" and "PA" in states:
+            raise ValueError("PA failed")
         return {
-            "win_probability": 0.5 + avg_margin,
-            "predicted_margin": avg_margin,
-            "margin_std": 0.05,
+            state: self.fit_and_forecast(
+                train_polls_by_state[state],
+                forecast_date,
+                election_date,
+                actual_margin[state],
+            )
+            for state in states
+            if state != "PA"
         }
 
 
@@ -31,7 +63,15 @@ class TestElectionForecastModel:
         """Test that model initializes correctly"""
         model = MockModel()
         assert model.name == "mock_model"
-        assert model.predictions == []
+        assert model.predictions == {}
+
+    def test_subclasses_are_registered(self):
+        """Test that defining a subclass adds it to the model registry"""
+        from src.models.registry import discover_models
+
+        assert ElectionForecastModel.registry["MockModel"] is MockModel
+        # Test doubles are registered but never discovered as real models
+        assert "MockModel" not in dict(discover_models())
 
     @patch("src.models.base_model.load_polling_data")
     @patch("src.models.base_model.load_election_results")
@@ -48,6 +88,41 @@ class TestElectionForecastModel:
         assert isinstance(polls, pd.DataFrame)
         assert isinstance(results, dict)
 
+    @patch("src.models.base_model.load_polling_data")
+    @patch("src.models.base_model.load_election_results")
+    def test_load_data_is_cached(self, mock_results, mock_polls):
+        """Test that repeated load_data calls only read the files once"""
+        mock_polls.return_value = pd.DataFrame({"state_code": ["FL"]})
+        mock_results.return_value = {"FL": 0.012}
+
+        model = MockModel()
+        first = model.load_data()
+        second = model.load_data()
+
+        assert first is second
+        assert mock_polls.call_count == 1
+        assert mock_results.call_count == 1
+
+    @patch("src.models.base_model.load_polling_data")
+    @patch("src.models.base_model.load_election_results")
+    def test_load_data_reloads_after_config_change(self, mock_results, mock_polls):
+        """Test that the cache is keyed on the configured election"""
+        from src.utils.data_utils import set_election_config
+
+        mock_polls.return_value = pd.DataFrame({"state_code": ["FL"]})
+        mock_results.return_value = {"FL": 0.012}
+
+        model = MockModel()
+        try:
+            model.load_data()
+            set_election_config(year=2020)
+            model.load_data()
+            model.load_data()
+        finally:
+            set_election_config(year=2016)
+
+        assert mock_polls.call_count == 2
+
     def test_run_forecast_basic(self, sample_polls, sample_actual_results):
         """Test basic forecast run"""
         model = MockModel()
@@ -65,6 +140,33 @@ class TestElectionForecastModel:
         assert "win_probability" in result.columns
         assert "predicted_margin" in result.columns
 
+    def test_polls_up_to_matches_mask(self, sample_polls):
+        """Test that the binary-search prefix matches a boolean mask"""
+        shuffled = sample_polls.sample(frac=1.0, random_state=0)
+        # Polls without a middate must never be selected
+        shuffled.loc[shuffled.index[3], "middate"] = pd.NaT
+        grouped = ElectionForecastModel._group_polls_by_state(shuffled, ["FL"])
+        state_polls, order, sorted_middates_ns = grouped["FL"]
+
+        for forecast_date in pd.to_datetime(["2016-08-01", "2016-10-15", "2017-01-01"]):
+            expected = shuffled[shuffled["middate"] <= forecast_date]
+            cut = ElectionForecastModel._cut_index(
+                sorted_middates_ns, np.int64(forecast_date.value)
+            )
+            result = ElectionForecastModel._polls_up_to(state_polls, order, cut)
+            pd.testing.assert_frame_equal(result, expected)
+
+    def test_state_polls_matches_mask(self, multi_state_polls):
+        """Test that the sorted-slice poll lookup matches a boolean mask"""
+        polls = multi_state_polls.sample(frac=1.0, random_state=0)
+        # Polls without a state code are never returned
+        polls.loc[polls.index[0], "state_code"] = None
+        model = MockModel()
+
+        for state in ("FL", "PA", "XX"):
+            expected = polls[polls["state_code"] == state]
+            pd.testing.assert_frame_equal(model._state_polls(polls, state), expected)
+
     def test_run_forecast_min_polls_filter(self, sample_polls, sample_actual_results):
         """Test that states with insufficient polls are filtered"""
         model = MockModel()
@@ -78,6 +180,87 @@ class TestElectionForecastModel:
         # Should have no predictions with min_polls=100
         assert len(result) == 0
 
+    def test_run_forecast_parallel_matches_sequential(
+        self, forecasted_model, multi_state_polls, sample_actual_results, forecast_dates
+    ):
+        """Test that the per-state process pool gives the sequential results"""
+
+        expected = forecasted_model.predictions_frame()
+
+        parallel = MockModel()
+        parallel._data_cache = (multi_state_polls, sample_actual_results)
+        result = parallel.run_forecast(
+            forecast_dates=forecast_dates, min_polls=5, n_workers=2
+        )
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_seeded_parallel_forecast_ignores_worker_count(
+        self, sample_polls, sample_actual_results, forecast_dates
+    ):
+        """Test that seeded random draws do not depend on how states are split"""
+        polls = pd.concat(
+            [sample_polls.assign(state_code=s) for s in ("FL", "PA", "MI", "WI")],
+            ignore_index=True,
+        )
+
+        results = []
+        for n_workers in (None, 2, 3):
+            model = NoisyModel()
+            model._data_cache = (polls, sample_actual_results)
+            results.append(
+                model.run_forecast(
+                    forecast_dates=forecast_dates, min_polls=5, n_workers=n_workers
+                )
+            )
+
+        assert results[0]["win_probability"].nunique() == len(results[0])
+        for result in results[1:]:
+            pd.testing.assert_frame_equal(result, results[0])
+
+    @pytest.mark.parametrize("mode", ["raise", "omit"])
+    def test_batched_forecast_falls_back_per_state(
+        self,
+        forecasted_model,
+        multi_state_polls,
+        sample_actual_results,
+        forecast_dates,
+        mode,
+    ):
+        """Test that a state the batch fails on is forecast on its own"""
+        expected = forecasted_model.predictions_frame()
+
+        model = FlakyBatchedModel(mode)
+        model._data_cache = (multi_state_polls, sample_actual_results)
+        result = model.run_forecast(forecast_dates=forecast_dates, min_polls=5)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_fit_and_update_receives_new_polls(
+        self, sample_polls, sample_actual_results
+    ):
+        """Test that forecast dates run in ascending order with only new polls"""
+        calls = []
+
+        class RecordingModel(MockModel):
+            def fit_and_update(
+                self, state_polls, new_polls, forecast_date, *args, **kw
+            ):
+                calls.append((forecast_date, state_polls, new_polls))
+                return super().fit_and_update(
+                    state_polls, new_polls, forecast_date, *args, **kw
+                )
+
+        model = RecordingModel()
+        model._data_cache = (sample_polls, sample_actual_results)
+        forecast_dates = [pd.to_datetime("2016-11-01"), pd.to_datetime("2016-10-15")]
+        model.run_forecast(forecast_dates=forecast_dates, min_polls=5)
+
+        assert [c[0] for c in calls] == sorted(forecast_dates)
+        seen = pd.concat([c[2] for c in calls])
+        pd.testing.assert_frame_equal(seen.sort_index(), calls[-1][1].sort_index())
+        assert calls[0][1].equals(calls[0][2])
+
     def test_run_forecast_verbose(self, sample_polls, sample_actual_results, caplog):
         """Test verbose output"""
         import logging
@@ -110,8 +293,31 @@ class TestElectionForecastModel:
 
         assert (tmp_path / "predictions" / "mock_model.csv").exists()
         assert (tmp_path / "metrics" / "mock_model.txt").exists()
+        assert (tmp_path / "metrics" / "mock_model.csv").exists()
         assert isinstance(metrics_df, pd.DataFrame)
 
+    def test_save_results_removes_stale_parquet(
+        self, sample_polls, sample_actual_results, tmp_path, monkeypatch
+    ):
+        """Test that a Parquet copy is never left older than the CSV"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("src.models.base_model.parquet_available", lambda: False)
+        stale = tmp_path / "predictions" / "mock_model.parquet"
+        stale.parent.mkdir()
+        stale.write_bytes(b"stale")
+        stale_metrics = tmp_path / "metrics" / "mock_model.parquet"
+        stale_metrics.parent.mkdir()
+        stale_metrics.write_bytes(b"stale")
+
+        model = MockModel()
+        model._data_cache = (sample_polls, sample_actual_results)
+        model.run_forecast(forecast_dates=[pd.to_datetime("2016-10-15")], min_polls=5)
+        model.save_results()
+
+        assert (tmp_path / "predictions" / "mock_model.csv").exists()
+        assert not stale.exists()
+        assert not stale_metrics.exists()
+
     def test_plot_state_creates_file(
         self, sample_polls, sample_actual_results, tmp_path, monkeypatch
     ):
@@ -129,7 +335,199 @@ class TestElectionForecastModel:
             model.run_forecast(forecast_dates=forecast_dates, min_polls=5)
             model.plot_state("FL")
 
+        legacy_png = tmp_path / "plots" / "mock_model" / "FL.png"
+        assert legacy_png.exists()
+        year_png = tmp_path / "plots" / "mock_model" / "2016" / "FL.png"
+        assert year_png.read_bytes() == legacy_png.read_bytes()
+
+    @pytest.mark.parametrize("backend", ["svg", "pdf"])
+    def test_plot_state_under_non_agg_backend(
+        self, forecasted_model, tmp_path, monkeypatch, backend
+    ):
+        """Test that plot_state saves PNGs when the canvas is not Agg-based"""
+        import matplotlib.pyplot as plt
+
+        monkeypatch.chdir(tmp_path)
+        model = forecasted_model
+
+        previous_backend = plt.get_backend()
+        plt.switch_backend(backend)
+        try:
+            model.plot_state("FL")
+        finally:
+            plt.switch_backend(previous_backend)
+
+        legacy_png = tmp_path / "plots" / "mock_model" / "FL.png"
+        assert legacy_png.read_bytes().startswith(b"\x89PNG")
+        year_png = tmp_path / "plots" / "mock_model" / "2016" / "FL.png"
+        assert year_png.read_bytes() == legacy_png.read_bytes()
+
+    def test_plot_state_honours_savefig_dpi(
+        self, forecasted_model, tmp_path, monkeypatch
+    ):
+        """Test that the savefig.dpi rcParam still sets the PNG size"""
+        import matplotlib
+        import matplotlib.image as mimage
+
+        monkeypatch.chdir(tmp_path)
+        model = forecasted_model
+
+        with matplotlib.rc_context({"savefig.dpi": 50}):
+            model.plot_state("FL")
+
+        image = mimage.imread(tmp_path / "plots" / "mock_model" / "FL.png")
+        assert image.shape[:2] == (6 * 50, 12 * 50)
+
+    def test_plot_state_with_dataframe_predictions(
+        self, forecasted_model, tmp_path, monkeypatch
+    ):
+        """Test that predictions assigned as a DataFrame are plotted as-is"""
+        monkeypatch.chdir(tmp_path)
+        model = forecasted_model
+        pred_df = model.predictions_frame()
+
+        model.predictions = pred_df
+        assert model.predictions_frame() is pred_df
+
+        model.plot_state("FL")
+        assert (tmp_path / "plots" / "mock_model" / "FL.png").exists()
+
+    def test_predictions_frame_parses_string_dates(
+        self, forecasted_model, tmp_path, monkeypatch
+    ):
+        """Test that an assigned frame with string dates is parsed once"""
+        monkeypatch.chdir(tmp_path)
+        model = forecasted_model
+        pred_df = model.predictions_frame()
+
+        model.predictions = pred_df.assign(
+            forecast_date=pred_df["forecast_date"].dt.strftime("%Y-%m-%d")
+        )
+        parsed = model.predictions_frame()
+
+        assert parsed["forecast_date"].dtype.kind == "M"
+        assert model.predictions_frame() is parsed
+        model.plot_state("FL")
+        assert (tmp_path / "plots" / "mock_model" / "FL.png").exists()
+
+    def test_state_predictions_are_sorted_arrays(
+        self, forecasted_model, forecast_dates
+    ):
+        """Test that a state's plotted columns come back in date order"""
+        model = forecasted_model
+        pred_df = model.predictions_frame()
+
+        # Same rows in reverse order, both as column arrays and as a DataFrame
+        reversed_df = pred_df.iloc[::-1].reset_index(drop=True)
+        for predictions in (
+            {col: reversed_df[col].to_numpy() for col in reversed_df.columns},
+            reversed_df,
+        ):
+            model.predictions = predictions
+            state_preds = model._state_predictions("FL")
+
+            assert list(state_preds["forecast_date"]) == forecast_dates
+            assert list(state_preds["predicted_margin"]) == list(
+                pred_df.loc[pred_df["state"] == "FL", "predicted_margin"]
+            )
+        assert model._state_predictions("XX") is None
+
+    def test_plot_state_parses_string_dates_in_column_arrays(
+        self, forecasted_model, tmp_path, monkeypatch
+    ):
+        """Test that assigned column arrays with string dates are plotted"""
+        monkeypatch.chdir(tmp_path)
+        model = forecasted_model
+        pred_df = model.predictions_frame()
+
+        model.predictions = {
+            col: pred_df[col].astype(str).to_numpy()
+            if col == "forecast_date"
+            else pred_df[col].to_numpy()
+            for col in pred_df.columns
+        }
+        assert model._state_predictions("FL")["forecast_date"].dtype.kind == "M"
+
+        model.plot_state("FL")
+        assert (tmp_path / "plots" / "mock_model" / "FL.png").exists()
+
+    def test_plot_state_reuses_axes(self, forecasted_model, tmp_path, monkeypatch):
+        """Test that plot_state draws on a caller-supplied Axes and keeps it open"""
+        import matplotlib.pyplot as plt
+
+        monkeypatch.chdir(tmp_path)
+        model = forecasted_model
+
+        fig, ax = plt.subplots()
+        model.plot_state("FL", ax=ax)
+        model.plot_state("FL", ax=ax)
+
+        assert plt.fignum_exists(fig.number)
+        assert len(ax.get_legend_handles_labels()[1]) == 4
+        assert (tmp_path / "plots" / "mock_model" / "FL.png").exists()
+        plt.close(fig)
+
+    def test_plot_all_states_loads_data_once(
+        self, forecasted_model, tmp_path, monkeypatch
+    ):
+        """Test that batch plotting loads the data once for all states"""
+        monkeypatch.chdir(tmp_path)
+        model = forecasted_model
+
+        with patch.object(model, "load_data", wraps=model.load_data) as mock_load_data:
+            n_plotted = model.plot_all_states()
+
+        assert mock_load_data.call_count == 1
+        assert n_plotted == 2
+        assert (tmp_path / "plots" / "mock_model" / "FL.png").exists()
+        assert (tmp_path / "plots" / "mock_model" / "PA.png").exists()
+
+    def test_plot_all_states_parallel_matches_serial(
+        self, forecasted_model, tmp_path, monkeypatch
+    ):
+        """Test that plotting in worker processes writes the same plots"""
+        import matplotlib.image as mimage
+
+        model = forecasted_model
+
+        for run, n_workers in (("serial", None), ("parallel", 2)):
+            (tmp_path / run).mkdir()
+            monkeypatch.chdir(tmp_path / run)
+            assert model.plot_all_states(n_workers=n_workers) == 2
+
+        serial_dir = tmp_path / "serial" / "plots" / "mock_model"
+        parallel_dir = tmp_path / "parallel" / "plots" / "mock_model"
+        for name in ("FL.png", "PA.png", "2016/FL.png", "2016/PA.png"):
+            parallel = mimage.imread(parallel_dir / name)
+            serial = mimage.imread(serial_dir / name)
+            assert parallel.shape == serial.shape
+            # FL is drawn on a fresh figure in both runs; later states reuse
+            # the figure serially, so their layout can differ slightly
+            if name.endswith("FL.png"):
+                np.testing.assert_array_equal(parallel, serial)
+
+    def test_plot_all_states_skips_failed_writes(
+        self, forecasted_model, tmp_path, monkeypatch, caplog
+    ):
+        """Test that a PNG write failing in a writer thread is not counted"""
+        from src.models import base_model
+
+        monkeypatch.chdir(tmp_path)
+        model = forecasted_model
+
+        write_png = base_model._write_png
+
+        def failing_write_png(rgba, dpi, paths):
+            if paths[0].name == "PA.png":
+                raise OSError("disk full")
+            write_png(rgba, dpi, paths)
+
+        monkeypatch.setattr(base_model, "_write_png", failing_write_png)
+        n_plotted = model.plot_all_states()
+
+        assert n_plotted == 1
         assert (tmp_path / "plots" / "mock_model" / "FL.png").exists()
+        assert "Could not plot PA: disk full" in caplog.text
 
     def test_fit_and_forecast_not_implemented(self):
         """Test that base class fit_and_forecast is abstract"""
@@ -1,5 +1,6 @@
 """Tests for data utility functions"""
 
+import pytest
 import pandas as pd
 import numpy as np
 from src.utils.data_utils import (
@@ -8,6 +9,8 @@ from src.utils.data_utils import (
     load_fundamentals,
     compute_metrics,
     get_state_list,
+    fast_io_enabled,
+    _load_with_parquet_cache,
 )
 
 
@@ -49,6 +52,49 @@ class TestLoadPollingData:
         """Test that dates are properly converted to datetime"""
         polls = load_polling_data()
         assert pd.api.types.is_datetime64_any_dtype(polls["middate"])
+        assert polls["middate"].dtype == "datetime64[ns]"
+
+    def test_fast_io_is_opt_in(self, monkeypatch):
+        """Test that the pyarrow CSV path needs ELECTION_FAST_IO"""
+        monkeypatch.delenv("ELECTION_FAST_IO", raising=False)
+        assert not fast_io_enabled()
+        monkeypatch.setenv("ELECTION_FAST_IO", "0")
+        assert not fast_io_enabled()
+
+    def test_parquet_cache_skipped_without_engine(self, tmp_path, monkeypatch):
+        """Test that polls load straight from CSV when Parquet is unavailable"""
+        monkeypatch.setattr("src.utils.data_utils.parquet_available", lambda: False)
+        csv_file = tmp_path / "polls.csv"
+        cache_file = tmp_path / "polls.parquet"
+        csv_file.write_text("state_code\nFL\n")
+        expected = pd.DataFrame({"state_code": ["FL"]})
+
+        result = _load_with_parquet_cache(
+            str(csv_file), str(cache_file), lambda: expected
+        )
+
+        assert result is expected
+        assert not cache_file.exists()
+
+    def test_corrupt_parquet_cache_is_rebuilt(self, tmp_path):
+        """Test that an unreadable Parquet cache falls back to load()"""
+        pytest.importorskip("pyarrow")
+        csv_file = tmp_path / "polls.csv"
+        cache_file = tmp_path / "polls.parquet"
+        csv_file.write_text("state_code\nFL\n")
+        cache_file.write_bytes(b"not parquet")
+        expected = pd.DataFrame({"state_code": ["FL"]})
+
+        result = _load_with_parquet_cache(
+            str(csv_file), str(cache_file), lambda: expected
+        )
+
+        assert result is expected
+        pd.testing.assert_frame_equal(pd.read_parquet(cache_file), expected)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "polls.csv",
+            "polls.parquet",
+        ]
 
     def test_polling_data_state_codes_valid(self):
         """Test that state codes are two-letter codes"""
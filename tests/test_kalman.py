@@ -0,0 +1,30 @@
+"""Tests for the shared Kalman filter / RTS smoother"""
+
+import numpy as np
+from src.utils.kalman import kalman_filter_smoother
+
+
+def test_static_state_is_precision_weighted_mean():
+    """With no drift or diffusion the final estimate is the weighted mean"""
+    observations = np.array([0.01, 0.03, -0.02, 0.04])
+    obs_variance = np.array([0.001, 0.002, 0.0005, 0.004])
+
+    x_smooth, P_smooth = kalman_filter_smoother(
+        [0, 3, 5, 9], observations, obs_variance, mu=0.0, sigma2=0.0
+    )
+
+    precision = 1.0 / obs_variance
+    expected = np.sum(precision * observations) / np.sum(precision)
+    np.testing.assert_allclose(x_smooth, expected)
+    np.testing.assert_allclose(P_smooth, 1.0 / np.sum(precision))
+
+
+def test_accepts_integer_dates():
+    """Test that non-float inputs are converted before the recursion"""
+    x_smooth, P_smooth = kalman_filter_smoother(
+        np.arange(5), [0.0, 0.01, 0.02, 0.015, 0.025], [0.001] * 5, 0.005, 0.0001
+    )
+
+    assert x_smooth.dtype == np.float64
+    assert np.all(np.isfinite(x_smooth))
+    assert np.all(P_smooth > 0)
@@ -0,0 +1,34 @@
+"""Tests for logging helpers"""
+
+import logging
+
+import pandas as pd
+
+from src.utils.logging_config import log_table
+
+
+class ExplodingTable:
+    """Stand-in table that fails if it is ever formatted"""
+
+    def to_string(self, **kwargs):
+        raise AssertionError("table was formatted for a filtered record")
+
+
+def test_log_table_formats_enabled_records(caplog):
+    """Test that the title and the formatted table are logged together"""
+    logger = logging.getLogger("test_log_table")
+    caplog.set_level(logging.INFO, logger="test_log_table")
+
+    log_table(logger, pd.DataFrame({"brier": [0.125]}), "Metrics:", index=False)
+
+    assert caplog.records[-1].getMessage() == "Metrics:\n brier\n 0.125"
+
+
+def test_log_table_skips_filtered_records(caplog):
+    """Test that nothing is formatted when the level is filtered out"""
+    logger = logging.getLogger("test_log_table")
+    caplog.set_level(logging.WARNING, logger="test_log_table")
+
+    log_table(logger, ExplodingTable(), "Metrics:")
+
+    assert not caplog.records
@@ -55,6 +55,32 @@ class TestPollAverageModel:
         assert isinstance(result, dict)
         assert "win_probability" in result
 
+    def test_batched_matches_per_state(self, sample_polls, election_date):
+        """Test that the vectorized batch gives the per-state forecasts"""
+        model = PollAverageModel()
+        forecast_date = pd.to_datetime("2016-10-15")
+        train_polls_by_state = {
+            "FL": sample_polls[sample_polls["middate"] <= forecast_date],
+            # Too few recent polls, so this state falls back to the last five
+            "PA": sample_polls.head(8),
+        }
+        actual_margin = {"FL": 0.012, "PA": 0.007}
+
+        batch = model.batched_fit_and_forecast(
+            ["FL", "PA"],
+            train_polls_by_state,
+            forecast_date,
+            election_date,
+            actual_margin,
+        )
+
+        for state, state_polls in train_polls_by_state.items():
+            expected = model.fit_and_forecast(
+                state_polls, forecast_date, election_date, actual_margin[state]
+            )
+            for key, value in expected.items():
+                assert batch[state][key] == pytest.approx(value, rel=1e-12)
+
 
 class TestKalmanDiffusionModel:
     """Tests for KalmanDiffusionModel"""
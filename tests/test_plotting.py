@@ -0,0 +1,41 @@
+"""Tests for plotting helpers"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+
+from src.utils.plotting import use_agg_backend
+
+
+def test_use_agg_backend_switches_loaded_matplotlib():
+    """Test that an already imported pyplot is switched to Agg"""
+    previous_backend = plt.get_backend()
+    plt.switch_backend("svg")
+    try:
+        use_agg_backend()
+        assert plt.get_backend().lower() == "agg"
+    finally:
+        plt.switch_backend(previous_backend)
+
+
+def test_script_main_keeps_the_callers_backend(tmp_path):
+    """Test that calling a script's main() as a function leaves the backend"""
+    code = (
+        "import matplotlib.pyplot as plt\n"
+        "plt.switch_backend('svg')\n"
+        "from src.scripts.compare_models import main\n"
+        "main()\n"
+        "print(plt.get_backend())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+    )
+    assert result.stdout.splitlines()[-1] == "svg"
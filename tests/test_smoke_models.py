@@ -1,4 +1,8 @@
+import pandas as pd
+
 from src.scripts.run_all_models import (
+    _model_path,
+    _resolve_model,
     discover_models,
     generate_forecast_dates,
 )
@@ -56,3 +60,22 @@ def test_first_model_smoke():
     assert not (metrics_num == float("-inf")).any().any(), (
         "-inf in metric numeric columns"
     )
+
+
+def test_model_path_round_trip():
+    """Worker processes re-import each discovered model from its path"""
+    for _, ModelClass in discover_models():
+        assert _resolve_model(_model_path(ModelClass)) is ModelClass
+
+
+def test_generate_forecast_dates_spacing():
+    """Forecast dates run from start_date to the day before the election"""
+    dates = generate_forecast_dates(4, "2016-11-08", "2016-09-01")
+
+    assert dates == [
+        pd.Timestamp("2016-09-01"),
+        pd.Timestamp("2016-09-24"),
+        pd.Timestamp("2016-10-16"),
+        pd.Timestamp("2016-11-07"),
+    ]
+    assert generate_forecast_dates(1, "2016-11-08") == [pd.Timestamp("2016-11-07")]